@@ -9,8 +9,18 @@ from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
+from .capture import FrameCapture
+from .const import (
+    CAPTURE_DIRECTORY,
+    CONF_CAPTURE,
+    CONF_HOT_STANDBY,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_TRANSPORT,
+    DOMAIN,
+    TRANSPORT_STREAM,
+)
 from .coordinator import HargassnerDataUpdateCoordinator
+from .message_parser import load_firmware_tables
 from .telnet_client import HargassnerTelnetClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,10 +32,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hargassner Pellet Boiler from a config entry."""
     _LOGGER.debug("Setting up Hargassner integration for %s", entry.data.get(CONF_HOST))
 
+    firmware_version = entry.data.get("firmware", "V14_1HAR_q1")
+
+    # Load the firmware and detection tables off the event loop (cached)
+    await hass.async_add_executor_job(load_firmware_tables, firmware_version)
+
+    # Optional raw frame capture, one directory per entry
+    capture = None
+    if entry.data.get(CONF_CAPTURE, False):
+        capture = FrameCapture(hass.config.path(CAPTURE_DIRECTORY, entry.entry_id))
+
     # Create telnet client
     telnet_client = HargassnerTelnetClient(
         host=entry.data[CONF_HOST],
-        firmware_version=entry.data.get("firmware", "V14_1HAR_q1"),
+        firmware_version=firmware_version,
+        transport=entry.data.get(CONF_TRANSPORT, TRANSPORT_STREAM),
+        parse_in_executor=entry.data.get(CONF_PARSE_IN_EXECUTOR, False),
+        hot_standby=entry.data.get(CONF_HOT_STANDBY, False),
+        capture=capture,
     )
 
     # Create coordinator
@@ -63,6 +87,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator: HargassnerDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
         await coordinator.telnet_client.async_stop()
 
     return unload_ok
@@ -0,0 +1,304 @@
+"""Compressed rolling capture of raw pm frames."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import os
+import re
+import time
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .const import (
+    CAPTURE_BATCH_FRAMES,
+    CAPTURE_FILE_BYTES,
+    CAPTURE_FLUSH_INTERVAL,
+    CAPTURE_MAX_AGE,
+    CAPTURE_MAX_BYTES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_SUFFIX = ".pm.gz"
+
+# Optional timestamp prefix of DAQ log lines, e.g. "2024-01-31_12:00:00 pm ..."
+_LOG_TIMESTAMP = re.compile(rb"(\d{4}-\d{2}-\d{2}_\d{2}:\d{2}:\d{2})\s+")
+
+
+def encode_record(
+    previous: list[bytes] | None,
+    tokens: list[bytes],
+    elapsed_ms: int,
+) -> bytes:
+    """Encode one frame against the previous frame of the same file.
+
+    Records are text lines ``<ms>\\tF\\t<line>`` (full frame) or
+    ``<ms>\\tD\\t<gap>=<token> ...`` (changed tokens only, each index given
+    as distance to the previous change). ``<ms>`` is the time since the
+    previous record, or epoch milliseconds for the first record of a file.
+
+    Args:
+        previous: Tokens of the previous frame, or None at file start
+        tokens: Tokens of this frame
+        elapsed_ms: Milliseconds since the previous record (or epoch ms)
+
+    Returns:
+        Encoded record including line end
+    """
+    if previous is None or len(previous) != len(tokens):
+        return b"%d\tF\t%s\n" % (elapsed_ms, b" ".join(tokens))
+
+    changes = []
+    last = -1
+    for index, (old, new) in enumerate(zip(previous, tokens)):
+        if old != new:
+            changes.append(b"%d=%s" % (index - last, new))
+            last = index
+    return b"%d\tD\t%s\n" % (elapsed_ms, b" ".join(changes))
+
+
+def read_capture(path: str | Path) -> Iterator[tuple[float, bytes]]:
+    """Read frames back from a capture file.
+
+    Args:
+        path: Capture file written by FrameCapture
+
+    Yields:
+        Tuples of receive time (epoch seconds) and pm line (single-spaced)
+    """
+    tokens: list[bytes] = []
+    timestamp_ms = 0
+    first = True
+    with gzip.open(path, "rb") as file:
+        for record in file:
+            elapsed, kind, payload = record.rstrip(b"\n").split(b"\t", 2)
+            timestamp_ms = int(elapsed) if first else timestamp_ms + int(elapsed)
+            first = False
+
+            if kind == b"F":
+                tokens = payload.split(b" ")
+            else:
+                index = -1
+                for change in payload.split():
+                    gap, _, token = change.partition(b"=")
+                    index += int(gap)
+                    tokens[index] = token
+            yield timestamp_ms / 1000, b" ".join(tokens)
+
+
+def read_log(path: str | Path) -> Iterator[tuple[float | None, bytes]]:
+    """Read pm lines from a DAQ log or plain text file.
+
+    Lines may carry a ``YYYY-MM-DD_HH:MM:SS`` prefix (local time); all
+    other lines (header, DAQPRJ template, ...) are skipped.
+
+    Args:
+        path: Log file with one pm line per row
+
+    Yields:
+        Tuples of recorded time (epoch seconds, None without prefix) and
+        pm line
+    """
+    with open(path, "rb") as file:
+        for row in file:
+            line = row.strip()
+            timestamp = None
+            match = _LOG_TIMESTAMP.match(line)
+            if match:
+                timestamp = datetime.strptime(
+                    match.group(1).decode(), "%Y-%m-%d_%H:%M:%S"
+                ).timestamp()
+                line = line[match.end() :]
+            if line.startswith(b"pm"):
+                yield timestamp, line
+
+
+def read_frames(path: str | Path) -> Iterator[tuple[float | None, bytes]]:
+    """Read recorded frames from a capture file or a DAQ/text log.
+
+    Args:
+        path: Capture file (``*.pm.gz``) or log file
+
+    Yields:
+        Tuples of recorded time (epoch seconds, or None if unknown) and
+        pm line
+    """
+    if str(path).endswith(CAPTURE_SUFFIX):
+        yield from read_capture(path)
+    else:
+        yield from read_log(path)
+
+
+def capture_files(directory: str | Path) -> list[Path]:
+    """Return capture files of a directory, oldest first.
+
+    Args:
+        directory: Capture directory
+
+    Returns:
+        Sorted capture file paths
+    """
+    path = Path(directory)
+    if not path.is_dir():
+        return []
+    return sorted(path.glob(f"*{CAPTURE_SUFFIX}"))
+
+
+class FrameCapture:
+    """Record raw pm lines to rotating, delta-encoded gzip files.
+
+    ``add`` only appends to an in-memory batch on the event loop. Batches are
+    encoded, compressed and written by an executor job every
+    CAPTURE_FLUSH_INTERVAL seconds (or when CAPTURE_BATCH_FRAMES are
+    pending); each batch becomes one gzip member. Files rotate at
+    CAPTURE_FILE_BYTES and old files are removed by age and total size.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        file_bytes: int = CAPTURE_FILE_BYTES,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        max_age: float = CAPTURE_MAX_AGE,
+    ) -> None:
+        """Initialize the capture.
+
+        Args:
+            directory: Directory for capture files
+            file_bytes: Compressed size at which a new file is started
+            max_bytes: Total size of all capture files to keep
+            max_age: Seconds after which capture files are removed
+        """
+        self._directory = Path(directory)
+        self._file_bytes = file_bytes
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+
+        # Event loop side
+        self._pending: list[tuple[float, bytes]] = []
+        self._task: asyncio.Task | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+
+        # Writer side (only touched by one executor job at a time)
+        self._path: Path | None = None
+        self._previous: list[bytes] | None = None
+        self._previous_ms = 0
+
+        self.frames_written = 0
+        self.bytes_written = 0
+
+    def add(self, line: bytes | memoryview) -> None:
+        """Queue a raw pm line for capture.
+
+        Args:
+            line: Complete pm line as received
+        """
+        self._pending.append((time.time(), bytes(line)))
+        if len(self._pending) >= CAPTURE_BATCH_FRAMES and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self.async_flush()
+            )
+
+    async def async_start(self) -> None:
+        """Start periodic flushing."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def async_stop(self) -> None:
+        """Stop periodic flushing and write pending frames."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.async_flush()
+
+    async def _flush_loop(self) -> None:
+        """Flush pending frames periodically."""
+        while True:
+            await asyncio.sleep(CAPTURE_FLUSH_INTERVAL)
+            await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write pending frames in an executor job."""
+        async with self._write_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.write_batch, batch
+                )
+            except OSError as err:
+                _LOGGER.warning("Failed to write frame capture: %s", err)
+
+    def write_batch(self, batch: list[tuple[float, bytes]]) -> None:
+        """Encode, compress and append a batch, then apply retention.
+
+        Runs in an executor thread.
+
+        Args:
+            batch: Tuples of receive time (epoch seconds) and pm line
+        """
+        if self._path is None or not self._path.exists() or (
+            self._path.stat().st_size >= self._file_bytes
+        ):
+            self._directory.mkdir(parents=True, exist_ok=True)
+            started = datetime.fromtimestamp(batch[0][0], timezone.utc)
+            self._path = self._directory / (
+                f"capture_{started:%Y%m%d_%H%M%S_%f}{CAPTURE_SUFFIX}"
+            )
+            self._previous = None
+
+        records = []
+        previous = self._previous
+        previous_ms = self._previous_ms
+        for timestamp, line in batch:
+            timestamp_ms = int(timestamp * 1000)
+            tokens = line.split()
+            elapsed = timestamp_ms if previous is None else timestamp_ms - previous_ms
+            records.append(encode_record(previous, tokens, elapsed))
+            previous, previous_ms = tokens, timestamp_ms
+
+        data = b"".join(records)
+        try:
+            with gzip.open(self._path, "ab", compresslevel=6) as file:
+                file.write(data)
+        except OSError:
+            # The file may miss (part of) this batch: continue in a new file
+            # that starts with a full frame instead of deltas against it
+            self._path = None
+            self._previous = None
+            raise
+        self._previous = previous
+        self._previous_ms = previous_ms
+        self.frames_written += len(batch)
+        self.bytes_written += len(data)
+
+        self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        """Remove capture files exceeding the age or total size limit."""
+        files = capture_files(self._directory)
+        cutoff = time.time() - self._max_age
+        sizes = {path: path.stat().st_size for path in files}
+        total = sum(sizes.values())
+
+        for path in files:
+            if path == self._path:
+                break
+            if total <= self._max_bytes and path.stat().st_mtime >= cutoff:
+                continue
+            try:
+                os.remove(path)
+            except OSError as err:
+                _LOGGER.debug("Failed to remove capture file %s: %s", path, err)
+                continue
+            total -= sizes[path]
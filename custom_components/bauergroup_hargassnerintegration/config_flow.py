@@ -14,26 +14,47 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_CADENCE_COUNTER,
+    CONF_CADENCE_SETPOINT,
+    CONF_CAPTURE,
+    CONF_DEADBANDS,
     CONF_DEVICE_NAME,
     CONF_EFFICIENCY,
     CONF_FIRMWARE,
+    CONF_HOT_STANDBY,
     CONF_LANGUAGE,
+    CONF_MAX_SILENCE,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PARSE_IN_EXECUTOR,
     CONF_PELLET_ENERGY,
     CONF_SENSOR_SET,
+    CONF_STATE_UPDATE_INTERVALS,
+    CONF_TRANSPORT,
+    DEADBAND_MAX_SILENCE,
     DEFAULT_EFFICIENCY,
     DEFAULT_PELLET_ENERGY,
     DOMAIN,
     FIRMWARE_VERSIONS,
+    GROUP_CADENCES,
     LANGUAGE_DE,
     LANGUAGE_EN,
+    PARAMETER_GROUP_COUNTER,
+    PARAMETER_GROUP_SETPOINT,
     SENSOR_SET_FULL,
     SENSOR_SET_STANDARD,
+    TRANSPORT_BUFFERED,
+    TRANSPORT_STREAM,
+    UPDATE_HEARTBEAT,
+    UPDATE_INTERVAL,
 )
+from .deadband import parse_deadbands
 from .exceptions import (
     HargassnerConnectionError,
     HargassnerTimeoutError,
 )
+from .message_parser import load_firmware_tables
 from .telnet_client import HargassnerTelnetClient
+from .update_rate import parse_state_intervals
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,6 +73,7 @@ async def validate_connection(hass: HomeAssistant, host: str, firmware: str) ->
     Raises:
         Exception if connection fails
     """
+    await hass.async_add_executor_job(load_firmware_tables, firmware)
     client = HargassnerTelnetClient(host=host, firmware_version=firmware)
 
     try:
@@ -155,7 +177,19 @@ class HargassnerOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
+            try:
+                parse_deadbands(user_input.get(CONF_DEADBANDS, ""))
+            except ValueError:
+                errors[CONF_DEADBANDS] = "invalid_deadbands"
+            try:
+                parse_state_intervals(user_input.get(CONF_STATE_UPDATE_INTERVALS, ""))
+            except ValueError:
+                errors[CONF_STATE_UPDATE_INTERVALS] = "invalid_state_update_intervals"
+
+        if user_input is not None and not errors:
             # Update entry.data with new options (options alone won't reload sensors)
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
@@ -174,6 +208,30 @@ class HargassnerOptionsFlow(config_entries.OptionsFlow):
         current_efficiency = self.config_entry.data.get(
             CONF_EFFICIENCY, DEFAULT_EFFICIENCY
         )
+        current_transport = self.config_entry.data.get(
+            CONF_TRANSPORT, TRANSPORT_STREAM
+        )
+        current_parse_in_executor = self.config_entry.data.get(
+            CONF_PARSE_IN_EXECUTOR, False
+        )
+        current_hot_standby = self.config_entry.data.get(CONF_HOT_STANDBY, False)
+        current_capture = self.config_entry.data.get(CONF_CAPTURE, False)
+        current_min_update_interval = self.config_entry.data.get(
+            CONF_MIN_UPDATE_INTERVAL, UPDATE_INTERVAL
+        )
+        current_state_update_intervals = self.config_entry.data.get(
+            CONF_STATE_UPDATE_INTERVALS, ""
+        )
+        current_deadbands = self.config_entry.data.get(CONF_DEADBANDS, "")
+        current_max_silence = self.config_entry.data.get(
+            CONF_MAX_SILENCE, DEADBAND_MAX_SILENCE
+        )
+        current_cadence_setpoint = self.config_entry.data.get(
+            CONF_CADENCE_SETPOINT, GROUP_CADENCES[PARAMETER_GROUP_SETPOINT]
+        )
+        current_cadence_counter = self.config_entry.data.get(
+            CONF_CADENCE_COUNTER, GROUP_CADENCES[PARAMETER_GROUP_COUNTER]
+        )
 
         data_schema = vol.Schema(
             {
@@ -189,10 +247,35 @@ class HargassnerOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(CONF_EFFICIENCY, default=current_efficiency): vol.All(
                     vol.Coerce(int), vol.Range(min=50, max=100)
                 ),
+                vol.Optional(
+                    CONF_MIN_UPDATE_INTERVAL, default=current_min_update_interval
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=UPDATE_HEARTBEAT)),
+                vol.Optional(
+                    CONF_STATE_UPDATE_INTERVALS, default=current_state_update_intervals
+                ): cv.string,
+                vol.Optional(CONF_DEADBANDS, default=current_deadbands): cv.string,
+                vol.Optional(CONF_MAX_SILENCE, default=current_max_silence): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=3600)
+                ),
+                vol.Optional(
+                    CONF_CADENCE_SETPOINT, default=current_cadence_setpoint
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_CADENCE_COUNTER, default=current_cadence_counter
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(CONF_TRANSPORT, default=current_transport): vol.In(
+                    [TRANSPORT_STREAM, TRANSPORT_BUFFERED]
+                ),
+                vol.Optional(
+                    CONF_PARSE_IN_EXECUTOR, default=current_parse_in_executor
+                ): cv.boolean,
+                vol.Optional(CONF_HOT_STANDBY, default=current_hot_standby): cv.boolean,
+                vol.Optional(CONF_CAPTURE, default=current_capture): cv.boolean,
             }
         )
 
         return self.async_show_form(
             step_id="init",
             data_schema=data_schema,
+            errors=errors,
         )
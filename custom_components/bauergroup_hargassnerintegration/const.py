@@ -11,6 +11,19 @@ CONF_LANGUAGE: Final = "language"
 CONF_SENSOR_SET: Final = "sensor_set"
 CONF_PELLET_ENERGY: Final = "pellet_energy_kwh_per_kg"
 CONF_EFFICIENCY: Final = "efficiency_percent"
+CONF_TRANSPORT: Final = "transport"
+CONF_PARSE_IN_EXECUTOR: Final = "parse_in_executor"
+CONF_HOT_STANDBY: Final = "hot_standby"
+CONF_CAPTURE: Final = "capture_frames"
+CONF_MIN_UPDATE_INTERVAL: Final = "min_update_interval"
+CONF_DEADBANDS: Final = "deadbands"
+CONF_MAX_SILENCE: Final = "max_silence"
+CONF_CADENCE_SETPOINT: Final = "cadence_setpoint"
+CONF_CADENCE_COUNTER: Final = "cadence_counter"
+CONF_STATE_UPDATE_INTERVALS: Final = "state_update_intervals"
+
+# Name matching every channel or state in deadband and update interval options
+WILDCARD: Final = "*"
 
 # Language options
 LANGUAGE_EN: Final = "EN"
@@ -20,15 +33,71 @@ LANGUAGE_DE: Final = "DE"
 SENSOR_SET_STANDARD: Final = "STANDARD"
 SENSOR_SET_FULL: Final = "FULL"
 
+# Transport options (receive path of the telnet connection)
+TRANSPORT_STREAM: Final = "STREAM"
+TRANSPORT_BUFFERED: Final = "BUFFERED"
+
 # Telnet settings
 TELNET_PORT: Final = 23
 TELNET_TIMEOUT: Final = 10.0
 TELNET_RECONNECT_DELAY: Final = 5.0
 TELNET_MAX_RECONNECT_DELAY: Final = 300.0
 TELNET_BUFFER_SIZE: Final = 65536
+TELNET_START_TIMEOUT: Final = 5.0  # seconds async_start waits for the connection
+TELNET_FRAME_PERIOD: Final = 1.0  # expected seconds between pm frames until measured
+TELNET_FRAME_LATE_FACTOR: Final = 1.5  # frame periods after which a frame counts as late
+TELNET_STALE_FRAMES: Final = 10  # reconnect after this many frame periods without a valid frame
+TELNET_STALE_MIN_TIMEOUT: Final = 5.0  # lower bound for the stale-stream watchdog
+TELNET_STANDBY_RETRY_DELAY: Final = 60.0  # seconds before a lost standby is reopened
+TELNET_KEEPALIVE_IDLE: Final = 10  # seconds idle before TCP keepalive probes
+TELNET_KEEPALIVE_INTERVAL: Final = 5  # seconds between keepalive probes
+TELNET_KEEPALIVE_COUNT: Final = 3  # failed probes before the socket is dropped
+
+# Update intervals (the coordinator is pushed by the telnet client)
+UPDATE_INTERVAL: Final = 5  # default minimum seconds between entity updates
+UPDATE_HEARTBEAT: Final = 60  # seconds without a push before the coordinator checks in
+STATE_UPDATE_INTERVALS: Final = {  # seconds between entity updates by boiler state (ZK)
+    "Off": 30,
+    "Boiler start": 1,
+    "Monitoring ignition": 1,
+    "Ignition": 1,
+    "Transition to FF": 1,
+    "Ember preservation": 30,
+}  # states not listed use the minimum update interval
 
-# Update intervals
-UPDATE_INTERVAL: Final = 5  # seconds
+# Significant-change filtering of entity updates
+DEADBAND_UNIT_DEFAULTS: Final = {"°C": 0.5, "%": 1.0}  # absolute deadband per unit
+DEADBAND_RESOLUTION_STEPS: Final = 2  # default deadband in resolution steps (10^-dop)
+DEADBAND_DEFAULT_RESOLUTION: Final = 0.1  # resolution of float channels without dop
+DEADBAND_MAX_SILENCE: Final = 300  # seconds before a sub-deadband change is published anyway
+
+# Publish groups of parameters (see PARAMETER_GROUPS in firmware_templates.py)
+PARAMETER_GROUP_FAST: Final = "fast"
+PARAMETER_GROUP_SETPOINT: Final = "setpoint"
+PARAMETER_GROUP_COUNTER: Final = "counter"
+GROUP_CADENCES: Final = {  # default minimum seconds between updates per group
+    PARAMETER_GROUP_FAST: 0,  # limited by the minimum update interval only
+    PARAMETER_GROUP_SETPOINT: 60,
+    PARAMETER_GROUP_COUNTER: 300,
+}
+
+# Data callbacks (fan-out from the telnet client)
+CALLBACK_POLICY_DROP_OLDEST: Final = "drop_oldest"
+CALLBACK_POLICY_CONFLATE: Final = "conflate"
+CALLBACK_QUEUE_SIZE: Final = 8  # frames queued per drop-oldest subscriber
+CALLBACK_DURATION_BUCKETS: Final = (0.001, 0.01, 0.1, 1.0)  # seconds
+
+# Raw frame capture (debugging)
+CAPTURE_DIRECTORY: Final = "hargassner_capture"  # below the HA config directory
+CAPTURE_FILE_BYTES: Final = 1_000_000  # compressed bytes per capture file
+CAPTURE_MAX_BYTES: Final = 50_000_000  # total size of kept capture files
+CAPTURE_MAX_AGE: Final = 7 * 24 * 3600  # seconds capture files are kept
+CAPTURE_FLUSH_INTERVAL: Final = 30.0  # seconds between batched writes
+CAPTURE_BATCH_FRAMES: Final = 300  # pending frames that trigger an early write
+
+# Replay of recorded frames
+REPLAY_SPEED_MAX: Final = 0.0  # replay speed factor: as fast as possible
+REPLAY_BATCH_FRAMES: Final = 1000  # frames read per executor job
 
 # Connection states
 STATE_CONNECTED: Final = "connected"
@@ -91,12 +160,17 @@ ERROR_CODES: Final = {
 # When adding a new firmware version:
 # 1. Add the XML template to FIRMWARE_TEMPLATES in src/firmware_templates.py
 # 2. Add the version string here
-# 3. Run tools/parameter_validator.py to verify consistency
+# 3. Run tools/compile_templates.py to build firmware/<version>.json
+# 4. Run tools/parameter_validator.py to verify consistency
 FIRMWARE_VERSIONS: Final = [
     "V14_1HAR_q1",
     "V14_0HAR_q",
 ]
 
+# Firmware autodetection
+FIRMWARE_DETECT_FRAMES: Final = 3  # consecutive mismatching messages
+FIRMWARE_DETECT_MIN_SCORE: Final = 0.75
+
 # Energy calculation defaults
 DEFAULT_PELLET_ENERGY: Final = 4.8  # kWh per kg (Heizwert)
 DEFAULT_EFFICIENCY: Final = 90  # % Wirkungsgrad
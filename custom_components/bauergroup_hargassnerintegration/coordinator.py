@@ -1,23 +1,67 @@
 """Data update coordinator for Hargassner Pellet Boiler."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Mapping
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import (
+    CALLBACK_POLICY_CONFLATE,
+    CONF_CADENCE_COUNTER,
+    CONF_CADENCE_SETPOINT,
+    CONF_DEADBANDS,
+    CONF_MAX_SILENCE,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_STATE_UPDATE_INTERVALS,
+    DEADBAND_MAX_SILENCE,
+    DOMAIN,
+    GROUP_CADENCES,
+    PARAMETER_GROUP_COUNTER,
+    PARAMETER_GROUP_FAST,
+    PARAMETER_GROUP_SETPOINT,
+    UPDATE_HEARTBEAT,
+    UPDATE_INTERVAL,
+)
+from .deadband import Deadband, parse_deadbands, resolve_deadband
+from .message_parser import HargassnerFrame, get_firmware_schema
 from .telnet_client import HargassnerTelnetClient
-from .types import ParameterData
+from .update_rate import parse_state_intervals, resolve_state_intervals
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant schedules refreshes from the truncated loop time, so the
+# heartbeat may run up to this many seconds before UPDATE_HEARTBEAT passed
+_HEARTBEAT_MARGIN = 1.0
 
-class HargassnerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, ParameterData]]):
-    """Class to manage fetching Hargassner data from telnet client."""
+
+class HargassnerDataUpdateCoordinator(DataUpdateCoordinator[Mapping[str, Any]]):
+    """Class to manage Hargassner data pushed by the telnet client.
+
+    New frames are published as soon as they arrive, at most once per
+    update interval (the newest frame of a throttled burst is published
+    when the interval ends). The interval follows the boiler state (ZK,
+    see STATE_UPDATE_INTERVALS): idle states publish rarely, ignition
+    phases every second, other states use the minimum update interval; a
+    state change is published at once. The regular refresh only runs as a
+    heartbeat after UPDATE_HEARTBEAT seconds without a push and marks the
+    entities unavailable if the boiler went silent.
+
+    Listeners registered with a tuple of channel names as context are
+    indexed by channel and only called when one of their channels changed
+    significantly, i.e. by at least the channel's deadband since the value
+    last published for it, or at all after the maximum silence. Channels
+    of slow publish groups (setpoints, counters) are additionally held to
+    their group cadence, so they are published at most once per cadence.
+    Listeners without context (and all listeners on availability changes)
+    are called on every update.
+    """
 
     def __init__(
         self,
@@ -35,26 +79,88 @@ class HargassnerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, ParameterD
         self.telnet_client = telnet_client
         self.entry = entry
 
+        # Channels used by enabled entities (reference counted)
+        self._channel_refs: Counter[str] = Counter()
+        self._subscriptions_pending = False
+
+        # Push throttling (event loop time)
+        self._min_interval: float = entry.data.get(
+            CONF_MIN_UPDATE_INTERVAL, UPDATE_INTERVAL
+        )
+        self._last_push = float("-inf")
+        self._pending_frame: HargassnerFrame | None = None
+        self._pending_handle: asyncio.TimerHandle | None = None
+
+        # Update interval by boiler state (ZK value)
+        try:
+            state_overrides = parse_state_intervals(
+                entry.data.get(CONF_STATE_UPDATE_INTERVALS, "")
+            )
+        except ValueError as err:
+            _LOGGER.warning("Ignoring state update intervals: %s", err)
+            state_overrides = {}
+        self._state_intervals = resolve_state_intervals(state_overrides)
+        self._pushed_state: int | None = None
+        self._unsubscribe_state: CALLBACK_TYPE | None = None
+
+        # Channel-to-listener index for changed-only notification
+        self._channel_listeners: defaultdict[str, list[CALLBACK_TYPE]] = defaultdict(list)
+        self._plain_listeners: list[CALLBACK_TYPE] = []
+        self._notified_frame: HargassnerFrame | None = None
+        self._notified_available = False
+
+        # Significant-change filtering: deadbands and last published values
+        try:
+            self._deadband_overrides = parse_deadbands(entry.data.get(CONF_DEADBANDS, ""))
+        except ValueError as err:
+            _LOGGER.warning("Ignoring deadband configuration: %s", err)
+            self._deadband_overrides = {}
+        self._max_silence: float = entry.data.get(CONF_MAX_SILENCE, DEADBAND_MAX_SILENCE)
+        self._deadbands: dict[str, Deadband] = {}
+        self._published: dict[str, tuple[Any, float]] = {}
+
+        # Publish cadences per parameter group and resolved per channel
+        self._group_cadences: dict[str, float] = {
+            PARAMETER_GROUP_FAST: GROUP_CADENCES[PARAMETER_GROUP_FAST],
+            PARAMETER_GROUP_SETPOINT: entry.data.get(
+                CONF_CADENCE_SETPOINT, GROUP_CADENCES[PARAMETER_GROUP_SETPOINT]
+            ),
+            PARAMETER_GROUP_COUNTER: entry.data.get(
+                CONF_CADENCE_COUNTER, GROUP_CADENCES[PARAMETER_GROUP_COUNTER]
+            ),
+        }
+        self._cadences: dict[str, float] = {}
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=UPDATE_HEARTBEAT),
         )
 
-    async def _async_update_data(self) -> dict[str, ParameterData]:
+        telnet_client.register_callback(
+            self._async_handle_frame, policy=CALLBACK_POLICY_CONFLATE
+        )
+        if self._state_intervals:
+            # The rate depends on ZK even if the state sensor is disabled
+            self._unsubscribe_state = self.async_subscribe_channels(("ZK",))
+
+    async def _async_update_data(self) -> Mapping[str, Any]:
         """Fetch data from telnet client.
 
+        Runs on first refresh and as heartbeat when no frame was pushed
+        for UPDATE_HEARTBEAT seconds.
+
         Returns:
-            Dictionary with latest boiler data
+            Frame with latest boiler data
 
         Raises:
             UpdateFailed: If no data available or connection lost
         """
-        # Get latest data from telnet client
-        data = await self.telnet_client.get_latest_data()
+        # Latest immutable snapshot from the telnet client (no lock, no copy)
+        data = self.telnet_client.latest_data
 
-        if not data:
+        if data is None:
             # Check if connected
             if not self.telnet_client.connected:
                 raise UpdateFailed("Not connected to boiler")
@@ -63,11 +169,199 @@ class HargassnerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, ParameterD
             _LOGGER.debug("No data available yet, but connected")
             return {}
 
-        # Add connection metadata
-        data["_connection"] = {
-            "connected": self.telnet_client.connected,
-            "last_update": self.telnet_client.last_update,
-            "statistics": self.telnet_client.statistics,
-        }
+        if data.received_at is not None:
+            age = self.hass.loop.time() - data.received_at
+            if age > UPDATE_HEARTBEAT - _HEARTBEAT_MARGIN:
+                raise UpdateFailed(f"No data from boiler for {age:.0f} s")
 
         return data
+
+    @staticmethod
+    def _boiler_state(frame: HargassnerFrame) -> int | None:
+        """Return the boiler state (ZK) of a frame.
+
+        Args:
+            frame: Parsed frame
+
+        Returns:
+            ZK value, or None if not available
+        """
+        try:
+            return int(frame.get_value("ZK"))
+        except (TypeError, ValueError):
+            return None
+
+    @callback
+    def _async_handle_frame(self, frame: HargassnerFrame) -> None:
+        """Publish a pushed frame, throttled to the state's update interval.
+
+        Args:
+            frame: Newest frame from the telnet client
+        """
+        state = self._boiler_state(frame)
+        due = self._last_push + self._state_intervals.get(state, self._min_interval)
+        if self.hass.loop.time() >= due or state != self._pushed_state:
+            self._async_push(frame)
+            return
+
+        # Keep only the newest frame until the interval has passed
+        self._pending_frame = frame
+        if self._pending_handle is None:
+            self._pending_handle = self.hass.loop.call_at(
+                due, self._async_push_pending
+            )
+
+    @callback
+    def _async_push_pending(self) -> None:
+        """Publish the newest frame held back by the throttle."""
+        self._pending_handle = None
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is not None:
+            self._async_push(frame)
+
+    @callback
+    def _async_push(self, frame: HargassnerFrame) -> None:
+        """Publish a frame to the entities and restart the heartbeat.
+
+        Args:
+            frame: Frame to publish
+        """
+        if self._pending_handle is not None:
+            self._pending_handle.cancel()
+            self._pending_handle = None
+        self._pending_frame = None
+        self._last_push = self.hass.loop.time()
+        self._pushed_state = self._boiler_state(frame)
+        self.async_set_updated_data(frame)
+
+    async def async_shutdown(self) -> None:
+        """Stop receiving pushed frames and cancel scheduled updates."""
+        self.telnet_client.unregister_callback(self._async_handle_frame)
+        if self._unsubscribe_state is not None:
+            self._unsubscribe_state()
+            self._unsubscribe_state = None
+        if self._pending_handle is not None:
+            self._pending_handle.cancel()
+            self._pending_handle = None
+        await super().async_shutdown()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, optionally only for some channels.
+
+        Args:
+            update_callback: Function called on updates
+            context: Tuple of channel names the listener depends on, or None
+                to be called on every update
+
+        Returns:
+            Callback that removes the listener
+        """
+        remove = super().async_add_listener(update_callback, context)
+        channels: tuple[str, ...] = tuple(context) if context else ()
+        if channels:
+            schema = get_firmware_schema(self.telnet_client.firmware_version)
+            for name in channels:
+                self._channel_listeners[name].append(update_callback)
+                if name not in self._deadbands:
+                    param = schema.by_name.get(name)
+                    self._deadbands[name] = resolve_deadband(
+                        name, param, self._deadband_overrides
+                    )
+                    group = param.group if param else PARAMETER_GROUP_FAST
+                    self._cadences[name] = self._group_cadences.get(group, 0)
+        else:
+            self._plain_listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            remove()
+            if not channels:
+                self._plain_listeners.remove(update_callback)
+            for name in channels:
+                listeners = self._channel_listeners[name]
+                listeners.remove(update_callback)
+                if not listeners:
+                    del self._channel_listeners[name]
+
+        return _remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose channels changed significantly."""
+        frame = self.data if isinstance(self.data, HargassnerFrame) else None
+        previous, self._notified_frame = self._notified_frame, frame
+        available = self.last_update_success
+        now = self.hass.loop.time()
+        if frame is None or previous is None or available != self._notified_available:
+            # First frame, no frame or availability change: refresh all
+            self._notified_available = available
+            if frame is not None:
+                for name in self._channel_listeners:
+                    self._published[name] = (frame.get_value(name), now)
+            super().async_update_listeners()
+            return
+
+        updates = list(self._plain_listeners)
+        notified: set[CALLBACK_TYPE] = set()
+        for name, listeners in self._channel_listeners.items():
+            value = frame.get_value(name)
+            if name in self._published:
+                published, published_at = self._published[name]
+                if value == published or now - published_at < self._cadences[name]:
+                    continue
+                if not self._deadbands[name].exceeded(published, value) and (
+                    not self._max_silence or now - published_at < self._max_silence
+                ):
+                    continue
+            self._published[name] = (value, now)
+            for update_callback in listeners:
+                if update_callback not in notified:
+                    notified.add(update_callback)
+                    updates.append(update_callback)
+
+        for update_callback in updates:
+            update_callback()
+
+    @callback
+    def async_subscribe_channels(self, names: Iterable[str]) -> CALLBACK_TYPE:
+        """Register channels an entity needs parsed.
+
+        Only channels with at least one subscriber are converted by the
+        parser. Entities subscribe when added to Home Assistant, so disabled
+        entities never contribute.
+
+        Args:
+            names: Parameter names used by the caller
+
+        Returns:
+            Callback that removes the subscription
+        """
+        names = tuple(names)
+        self._channel_refs.update(names)
+        self._async_schedule_subscriptions()
+
+        @callback
+        def _unsubscribe() -> None:
+            self._channel_refs.subtract(names)
+            self._channel_refs += Counter()  # drop channels without references
+            self._async_schedule_subscriptions()
+
+        return _unsubscribe
+
+    @callback
+    def _async_schedule_subscriptions(self) -> None:
+        """Push the subscribed channel set to the client once per loop pass."""
+        if self._subscriptions_pending:
+            return
+        self._subscriptions_pending = True
+        self.hass.loop.call_soon(self._async_apply_subscriptions)
+
+    @callback
+    def _async_apply_subscriptions(self) -> None:
+        """Apply the current subscriptions to the telnet client."""
+        self._subscriptions_pending = False
+        _LOGGER.debug("Subscribed channels: %d", len(self._channel_refs))
+        self.telnet_client.set_subscriptions(self._channel_refs.keys())
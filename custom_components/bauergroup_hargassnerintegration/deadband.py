@@ -0,0 +1,124 @@
+"""Deadbands deciding which value changes are significant."""
+from __future__ import annotations
+
+import math
+from typing import Any, NamedTuple
+
+from .const import (
+    DEADBAND_DEFAULT_RESOLUTION,
+    DEADBAND_RESOLUTION_STEPS,
+    DEADBAND_UNIT_DEFAULTS,
+    WILDCARD,
+)
+from .message_parser import ParameterDefinition
+
+# Tolerance for float rounding when comparing a change to the deadband
+_EPSILON = 1e-9
+
+
+class Deadband(NamedTuple):
+    """Minimum change of a channel value that is published."""
+
+    value: float
+    relative: bool = False
+
+    def exceeded(self, old: Any, new: Any) -> bool:
+        """Return whether a change from old to new is significant.
+
+        Non-numeric values (including digital channels) are significant on
+        every change.
+
+        Args:
+            old: Last published value
+            new: Current value
+
+        Returns:
+            True if the change reaches the deadband
+        """
+        if old == new:
+            return False
+        if (
+            not isinstance(old, (int, float))
+            or not isinstance(new, (int, float))
+            or isinstance(old, bool)
+            or isinstance(new, bool)
+        ):
+            return True
+        limit = self.value * abs(old) if self.relative else self.value
+        return abs(new - old) + _EPSILON >= limit
+
+
+def default_deadband(param: ParameterDefinition | None) -> Deadband:
+    """Derive the deadband of a channel from its unit and dop.
+
+    Digital and integer channels (dop 0) publish every change. Other
+    channels use the deadband of their unit, or DEADBAND_RESOLUTION_STEPS
+    steps of their resolution.
+
+    Args:
+        param: Parameter definition, or None if unknown
+
+    Returns:
+        Default deadband
+    """
+    if param is None or param.is_digital or param.decimals == 0:
+        return Deadband(0.0)
+    if param.unit in DEADBAND_UNIT_DEFAULTS:
+        return Deadband(DEADBAND_UNIT_DEFAULTS[param.unit])
+    resolution = 10.0 ** -param.decimals if param.decimals else DEADBAND_DEFAULT_RESOLUTION
+    return Deadband(DEADBAND_RESOLUTION_STEPS * resolution)
+
+
+def parse_deadbands(text: str) -> dict[str, Deadband]:
+    """Parse a deadband configuration.
+
+    The configuration is a comma-separated list of ``NAME=VALUE`` (absolute)
+    or ``NAME=VALUE%`` (relative to the last published value) entries;
+    ``*`` sets the deadband of all channels without an own entry.
+
+    Args:
+        text: Configuration, e.g. ``"TK=1, O2=5%, *=0"``
+
+    Returns:
+        Deadbands by channel name
+
+    Raises:
+        ValueError: If an entry is malformed, negative or not finite
+    """
+    deadbands: dict[str, Deadband] = {}
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, separator, value = entry.partition("=")
+        name, value = name.strip(), value.strip()
+        if not separator or not name:
+            raise ValueError(f"Invalid deadband entry: {entry}")
+        relative = value.endswith("%")
+        number = float(value[:-1] if relative else value)
+        if not math.isfinite(number) or number < 0:
+            raise ValueError(f"Invalid deadband value: {entry}")
+        deadbands[name] = Deadband(number / 100 if relative else number, relative)
+    return deadbands
+
+
+def resolve_deadband(
+    name: str,
+    param: ParameterDefinition | None,
+    overrides: dict[str, Deadband],
+) -> Deadband:
+    """Return the deadband of a channel.
+
+    Args:
+        name: Channel name
+        param: Parameter definition, or None if unknown
+        overrides: Configured deadbands (see parse_deadbands)
+
+    Returns:
+        Configured deadband, or the default for the channel
+    """
+    if name in overrides:
+        return overrides[name]
+    if WILDCARD in overrides:
+        return overrides[WILDCARD]
+    return default_deadband(param)
@@ -9,6 +9,10 @@ class HargassnerConnectionError(HargassnerException):
     """Exception raised when connection to boiler fails."""
 
 
+class HargassnerEndOfDataError(HargassnerConnectionError):
+    """Exception raised when a replayed recording has no more frames."""
+
+
 class HargassnerTimeoutError(HargassnerException):
     """Exception raised when connection times out."""
 
@@ -0,0 +1,134 @@
+"""Callback fan-out with bounded per-subscriber queues."""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from .const import (
+    CALLBACK_DURATION_BUCKETS,
+    CALLBACK_POLICY_CONFLATE,
+    CALLBACK_POLICY_DROP_OLDEST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Histogram labels for CALLBACK_DURATION_BUCKETS plus the overflow bucket
+_BUCKET_LABELS = tuple(
+    f"<{bound * 1000:g}ms" for bound in CALLBACK_DURATION_BUCKETS
+) + (f">={CALLBACK_DURATION_BUCKETS[-1] * 1000:g}ms",)
+
+
+class CallbackSubscriber(Generic[_T]):
+    """Deliver items to one callback from its own bounded queue.
+
+    Publishing only appends to the queue, so a slow or failing callback never
+    delays the publisher. When the queue is full the oldest item is dropped
+    (CALLBACK_POLICY_DROP_OLDEST) or the pending item is replaced by the
+    newest one (CALLBACK_POLICY_CONFLATE); drops are counted.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[_T], Awaitable[None] | None],
+        policy: str,
+        maxsize: int,
+    ) -> None:
+        """Initialize the subscriber.
+
+        Args:
+            callback: Function or coroutine function receiving each item
+            policy: CALLBACK_POLICY_DROP_OLDEST or CALLBACK_POLICY_CONFLATE
+            maxsize: Queue size for the drop-oldest policy
+        """
+        if policy not in (CALLBACK_POLICY_DROP_OLDEST, CALLBACK_POLICY_CONFLATE):
+            raise ValueError(f"Unknown callback policy: {policy}")
+
+        self.callback = callback
+        self.policy = policy
+        self._queue: deque[_T] = deque(
+            maxlen=1 if policy == CALLBACK_POLICY_CONFLATE else max(1, maxsize)
+        )
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        # Counters
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_lag = 0
+        self.durations = [0] * len(_BUCKET_LABELS)
+
+    @property
+    def name(self) -> str:
+        """Return a readable name of the callback."""
+        return getattr(self.callback, "__qualname__", repr(self.callback))
+
+    def offer(self, item: _T) -> None:
+        """Queue an item without waiting for the callback.
+
+        Args:
+            item: Item to deliver
+        """
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self.dropped += 1
+        queue.append(item)
+        self.max_lag = max(self.max_lag, len(queue))
+        self._wakeup.set()
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def cancel(self) -> None:
+        """Stop delivering and discard queued items."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queue.clear()
+
+    async def _run(self) -> None:
+        """Deliver queued items one at a time."""
+        queue = self._queue
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while queue:
+                item = queue.popleft()
+                start = time.perf_counter()
+                try:
+                    result = self.callback(item)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as err:
+                    self.errors += 1
+                    _LOGGER.error(
+                        "Error in data callback %s: %s", self.name, err, exc_info=True
+                    )
+                duration = time.perf_counter() - start
+                self.durations[bisect_right(CALLBACK_DURATION_BUCKETS, duration)] += 1
+                self.delivered += 1
+
+                # Let the receiver run between deliveries
+                await asyncio.sleep(0)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return delivery statistics."""
+        return {
+            "policy": self.policy,
+            "lag": len(self._queue),
+            "max_lag": self.max_lag,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "durations": dict(zip(_BUCKET_LABELS, self.durations)),
+        }
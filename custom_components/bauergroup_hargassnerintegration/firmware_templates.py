@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Final
 
+from .const import PARAMETER_GROUP_COUNTER, PARAMETER_GROUP_SETPOINT
+
 # Firmware Templates
 #
 # XML templates in DAQPRJ format from Hargassner DAQ files.
@@ -306,3 +308,51 @@ PARAMETER_DESCRIPTIONS: Final[dict[str, dict[str, str]]] = {
     # Digital 8 - Reserved
     "Reserved_8": {"en": "Reserved Digital 8", "de": "Reserviert Digital 8"},
 }
+
+# Publish groups for parameters that change slower than the combustion signals
+# Format: {"parameter_name": group}; parameters not listed are PARAMETER_GROUP_FAST
+PARAMETER_GROUPS: Final[dict[str, str]] = {
+    # ===== SETPOINTS =====
+    # Boiler and buffer setpoints (combustion control targets O2soll, SZsoll,
+    # ESsoll and BLDC_ES soll follow the fire and stay fast)
+    "TKsoll": PARAMETER_GROUP_SETPOINT,
+    "TRLsoll": PARAMETER_GROUP_SETPOINT,
+    "Puffer_soll oben": PARAMETER_GROUP_SETPOINT,
+    "Puffer_soll unten": PARAMETER_GROUP_SETPOINT,
+    "ExtHK Solltmp.": PARAMETER_GROUP_SETPOINT,
+
+    # Power limits
+    "min.Leist.TRG": PARAMETER_GROUP_SETPOINT,
+    "max.Leist.TRG": PARAMETER_GROUP_SETPOINT,
+    "max.Leist.Fuell": PARAMETER_GROUP_SETPOINT,
+    "max.Leist.TPO": PARAMETER_GROUP_SETPOINT,
+
+    # Heating circuit and hot water setpoints
+    "TVLs_A": PARAMETER_GROUP_SETPOINT,
+    "TRs_A": PARAMETER_GROUP_SETPOINT,
+    "TVLs_1": PARAMETER_GROUP_SETPOINT,
+    "TRs_1": PARAMETER_GROUP_SETPOINT,
+    "TVLs_2": PARAMETER_GROUP_SETPOINT,
+    "TRs_2": PARAMETER_GROUP_SETPOINT,
+    "TVLs_B": PARAMETER_GROUP_SETPOINT,
+    "TRs_B": PARAMETER_GROUP_SETPOINT,
+    "TBs_A": PARAMETER_GROUP_SETPOINT,
+    "TBs_1": PARAMETER_GROUP_SETPOINT,
+    "TBs_B": PARAMETER_GROUP_SETPOINT,
+
+    # Heat demands
+    "Max Anf Kessel": PARAMETER_GROUP_SETPOINT,
+    "Max Anf ZenPuf": PARAMETER_GROUP_SETPOINT,
+    "HKR Anf": PARAMETER_GROUP_SETPOINT,
+    **{f"Anf. HKR{index}": PARAMETER_GROUP_SETPOINT for index in range(16)},
+
+    # ===== COUNTERS =====
+    "LZ ES seit Füll.": PARAMETER_GROUP_COUNTER,
+    "LZ ES seit F°ll.": PARAMETER_GROUP_COUNTER,  # V14_0 template spelling
+    "LZ ES seit Ent.": PARAMETER_GROUP_COUNTER,
+    "Anzahl Entasch.": PARAMETER_GROUP_COUNTER,
+    "Anzahl SR Beweg.": PARAMETER_GROUP_COUNTER,
+    "Lagerstand": PARAMETER_GROUP_COUNTER,
+    "Verbrauchszähler": PARAMETER_GROUP_COUNTER,
+    "Verbrauchsz°hler": PARAMETER_GROUP_COUNTER,  # V14_0 template spelling
+}
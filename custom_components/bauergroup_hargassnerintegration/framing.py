@@ -0,0 +1,101 @@
+"""Line framing for the Hargassner telnet stream."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from .const import TELNET_BUFFER_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode non-frame telnet output for diagnostics.
+
+    Args:
+        data: Raw bytes received from telnet
+
+    Returns:
+        Decoded text
+    """
+    # Try multiple encodings
+    for encoding in ["utf-8", "latin-1", "cp1252"]:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+
+    # Fallback: replace invalid characters
+    return data.decode("utf-8", errors="replace")
+
+
+class LineFramer:
+    """Reassemble telnet output into complete lines.
+
+    Received chunks are appended to a persistent buffer; only lines terminated
+    by a newline are emitted, a partial line waits for the next chunk. When a
+    chunk completes several frames (e.g. after a stall) only the newest frame
+    is returned and the older ones are counted as coalesced; an optional sink
+    still sees every pm line, oldest first.
+    """
+
+    def __init__(self, max_size: int = TELNET_BUFFER_SIZE) -> None:
+        """Initialize the framer.
+
+        Args:
+            max_size: Maximum length of an incomplete line before it is dropped
+        """
+        self._buffer = bytearray()
+        self._max_size = max_size
+        self.frames = 0
+        self.coalesced = 0
+        self.overflows = 0
+
+    def feed(
+        self,
+        data: bytes,
+        sink: Callable[[bytes], None] | None = None,
+    ) -> bytes | None:
+        """Add received bytes and return the newest complete frame.
+
+        Args:
+            data: Raw bytes received from telnet
+            sink: Optional function called with every completed pm line
+
+        Returns:
+            Newest complete pm line, or None if no frame was completed
+        """
+        buffer = self._buffer
+        buffer += data
+
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            if len(buffer) > self._max_size:
+                _LOGGER.debug("Dropping %d bytes without line end", len(buffer))
+                self.overflows += 1
+                buffer.clear()
+            return None
+
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[: end + 1]
+
+        newest = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith(b"pm"):
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Ignoring non-frame line: %s", _decode_text(line))
+                continue
+            self.frames += 1
+            if newest is not None:
+                self.coalesced += 1
+            newest = line
+            if sink is not None:
+                sink(line)
+        return newest
+
+    def reset(self) -> None:
+        """Discard any partial line, e.g. after a reconnect."""
+        self._buffer.clear()
@@ -1,14 +1,83 @@
 """Message parser for Hargassner telnet protocol."""
 from __future__ import annotations
 
+import json
 import logging
-import xml.etree.ElementTree as ET
-from typing import Any
+import warnings
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from .firmware_templates import FIRMWARE_TEMPLATES, PARAMETER_DESCRIPTIONS
+from .const import (
+    FIRMWARE_DETECT_FRAMES,
+    FIRMWARE_DETECT_MIN_SCORE,
+    FIRMWARE_VERSIONS,
+    PARAMETER_GROUP_FAST,
+)
+from .exceptions import HargassnerFirmwareError, HargassnerParseError
+
+if TYPE_CHECKING:
+    import numpy as np
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled firmware tables, generated by tools/compile_templates.py
+COMPILED_TEMPLATES_DIR = Path(__file__).parent / "firmware"
+
+# Plausible value ranges per unit for firmware detection
+_PLAUSIBLE_RANGES: dict[str, tuple[float, float]] = {
+    "°C": (-50.0, 1500.0),
+    "%": (-5.0, 250.0),
+}
+
+
+def _to_int(raw_value: str | bytes) -> int | float:
+    """Convert an integer channel (dop='0'), tolerating a decimal point."""
+    try:
+        return int(raw_value)
+    except ValueError:
+        return float(raw_value)
+
+
+def _to_number(raw_value: str | bytes) -> int | float:
+    """Convert a channel without dop: int for integer tokens, float otherwise."""
+    if (b"." if isinstance(raw_value, bytes) else ".") in raw_value:
+        return float(raw_value)
+    try:
+        return int(raw_value)
+    except ValueError:
+        return float(raw_value)
+
+
+def _to_floats(values: list[str] | list[bytes]) -> list[float]:
+    """Convert tokens to floats, mapping malformed tokens to NaN."""
+    result = []
+    for raw_value in values:
+        try:
+            result.append(float(raw_value))
+        except ValueError:
+            result.append(float("nan"))
+    return result
+
+
+def _get_converter(decimals: int | None) -> Callable[[str | bytes], Any]:
+    """Return the value converter for a channel's decimal places (dop).
+
+    Args:
+        decimals: Decimal places from the template's dop attribute
+
+    Returns:
+        Converter from raw token to number
+    """
+    if decimals == 0:
+        return _to_int
+    if decimals is None:
+        return _to_number
+    return float
+
 
 class ParameterDefinition:
     """Definition of a single parameter from firmware template."""
@@ -20,6 +89,9 @@ class ParameterDefinition:
         unit: str | None = None,
         is_digital: bool = False,
         bit_mask: int | None = None,
+        decimals: int | None = None,
+        description: dict[str, str] | str | None = None,
+        group: str = PARAMETER_GROUP_FAST,
     ) -> None:
         """Initialize parameter definition.
 
@@ -29,13 +101,19 @@ class ParameterDefinition:
             unit: Unit of measurement (e.g., '°C', '%')
             is_digital: Whether this is a digital (boolean) parameter
             bit_mask: For digital parameters, the bit mask to extract value
+            decimals: Decimal places from the template's dop attribute
+            description: Bilingual description (defaults to the name)
+            group: Publish group (PARAMETER_GROUP_*)
         """
         self.name = name
         self.index = index
         self.unit = unit
         self.is_digital = is_digital
         self.bit_mask = bit_mask
-        self.description = PARAMETER_DESCRIPTIONS.get(name, name)
+        self.decimals = decimals
+        self.converter = int if is_digital else _get_converter(decimals)
+        self.description = description if description is not None else name
+        self.group = group
 
     def parse_value(self, values: list[str]) -> Any:
         """Parse value from message array.
@@ -57,11 +135,8 @@ class ParameterDefinition:
                 int_value = int(raw_value)
                 return bool(int_value & self.bit_mask)
 
-            # Analog parameter - convert to number
-            # Try float first, fallback to int
-            if "." in raw_value:
-                return float(raw_value)
-            return int(raw_value)
+            # Analog parameter - converter chosen from dop
+            return self.converter(raw_value)
 
         except (ValueError, IndexError) as err:
             _LOGGER.debug(
@@ -73,136 +148,1020 @@ class ParameterDefinition:
             return None
 
 
+class FirmwareSchema:
+    """Immutable parameter tables for one firmware template.
+
+    Built once per firmware version by get_firmware_schema() and shared by
+    every parser instance in the process.
+    """
+
+    def __init__(
+        self,
+        firmware_version: str,
+        parameters: tuple[ParameterDefinition, ...],
+        analog_count: int,
+        digital_count: int,
+    ) -> None:
+        """Initialize firmware schema.
+
+        Args:
+            firmware_version: Firmware version the template belongs to
+            parameters: Parameter definitions in template order
+            analog_count: Number of analog values in a message
+            digital_count: Number of packed digital words in a message
+        """
+        self.firmware_version = firmware_version
+        self.parameters = parameters
+        self.by_name: Mapping[str, ParameterDefinition] = MappingProxyType(
+            {param.name: param for param in parameters}
+        )
+        self.analog_count = analog_count
+        self.digital_count = digital_count
+        self.expected_length = analog_count + digital_count
+
+        # Compiled parse plan: parallel columns over the analog channels.
+        # Digital channels are read from their packed word on access.
+        analog = [p for p in parameters if not p.is_digital]
+        self.plan_names = tuple(p.name for p in analog)
+        self.plan_indices = tuple(p.index for p in analog)
+        self.plan_converters = tuple(p.converter for p in analog)
+
+        # Digital columns: word offset and bit position per channel
+        digital = [p for p in parameters if p.is_digital]
+        self.digital_names = tuple(p.name for p in digital)
+        self.digital_offsets = tuple(p.index - analog_count for p in digital)
+        self.digital_bits = tuple((p.bit_mask or 1).bit_length() - 1 for p in digital)
+
+
+class ParsedBatch(NamedTuple):
+    """Column-oriented result of HargassnerMessageParser.parse_many()."""
+
+    analog: np.ndarray
+    digital: np.ndarray
+    analog_names: tuple[str, ...]
+    digital_names: tuple[str, ...]
+
+
+class HargassnerFrame(Mapping[str, dict[str, Any]]):
+    """Parsed telnet message backed by a value array.
+
+    Holds one value per analog channel plus the decoded digital words and
+    shares the static unit/description schema. Item access builds the
+    classic ``{"value", "unit", "description", "timestamp"}`` dict lazily,
+    so consumers using ``frame.get(name)`` keep working.
+
+    The telnet client stamps each frame before publishing it with a sequence
+    number (count of pm frames received, so coalesced frames show up as
+    gaps), the event loop time and wall clock time of reception, and the
+    event loop time of publication.
+    """
+
+    __slots__ = (
+        "schema",
+        "values",
+        "digital_words",
+        "digital_flips",
+        "changed",
+        "sequence",
+        "received_at",
+        "timestamp",
+        "published_at",
+    )
+
+    def __init__(
+        self,
+        schema: FirmwareSchema,
+        values: list[Any],
+        digital_words: tuple[int | None, ...],
+        digital_flips: tuple[int, ...] | None = None,
+        changed: frozenset[int] | None = None,
+    ) -> None:
+        """Initialize frame.
+
+        Args:
+            schema: Firmware schema the frame was parsed with
+            values: Analog values indexed by channel id (None if missing)
+            digital_words: Decoded digital words (None if missing)
+            digital_flips: Per-word XOR against the previous frame
+            changed: Channel indexes that changed since the previous frame
+        """
+        self.schema = schema
+        self.values = values
+        self.digital_words = digital_words
+        self.digital_flips = (
+            digital_flips
+            if digital_flips is not None
+            else tuple(word or 0 for word in digital_words)
+        )
+        self.changed = (
+            changed
+            if changed is not None
+            else frozenset(range(schema.expected_length))
+        )
+        self.sequence = 0
+        self.received_at: float | None = None
+        self.timestamp: str | None = None
+        self.published_at: float | None = None
+
+    def stamp(self, sequence: int, received_at: float, received_time: datetime) -> None:
+        """Record when the frame was received (before it is published).
+
+        Args:
+            sequence: Number of pm frames received up to this one
+            received_at: Monotonic (event loop) time of reception
+            received_time: Wall clock time of reception
+        """
+        self.sequence = sequence
+        self.received_at = received_at
+        self.timestamp = received_time.isoformat()
+
+    @property
+    def latency(self) -> float | None:
+        """Return seconds between reception and publication."""
+        if self.received_at is None or self.published_at is None:
+            return None
+        return self.published_at - self.received_at
+
+    def unchanged(self) -> HargassnerFrame:
+        """Return a frame with the same state and no changes.
+
+        Returns:
+            Frame sharing this frame's values with an empty change set
+        """
+        return HargassnerFrame(
+            self.schema,
+            self.values,
+            self.digital_words,
+            (0,) * len(self.digital_words),
+            frozenset(),
+        )
+
+    def changed_names(self) -> list[str]:
+        """Return names of parameters whose value changed.
+
+        Digital parameters are only included if their own bit flipped.
+
+        Returns:
+            Changed parameter names in template order
+        """
+        changed = self.changed
+        if not changed:
+            return []
+        analog_count = self.schema.analog_count
+        flips = self.digital_flips
+        return [
+            param.name
+            for param in self.schema.parameters
+            if param.index in changed
+            and (
+                not param.is_digital
+                or flips[param.index - analog_count] & param.bit_mask
+            )
+        ]
+
+    def _value(self, param: ParameterDefinition) -> Any:
+        """Return the raw value of a parameter, or None if missing."""
+        if not param.is_digital:
+            return self.values[param.index]
+
+        word = self.digital_words[param.index - self.schema.analog_count]
+        if word is None:
+            return None
+        return bool(word & param.bit_mask)
+
+    def changed_words(self) -> list[int]:
+        """Return indexes of digital words with flipped bits.
+
+        Returns:
+            Word indexes whose XOR against the previous frame is non-zero
+        """
+        return [index for index, flips in enumerate(self.digital_flips) if flips]
+
+    def bit_flipped(self, name: str) -> bool:
+        """Return whether a digital parameter changed since the previous frame.
+
+        Args:
+            name: Digital parameter name
+
+        Returns:
+            True if the parameter's bit flipped
+        """
+        param = self.schema.by_name.get(name)
+        if param is None or not param.is_digital:
+            return False
+        flips = self.digital_flips[param.index - self.schema.analog_count]
+        return bool(flips & param.bit_mask)
+
+    def get_value(self, name: str, default: Any = None) -> Any:
+        """Return the value of a parameter without building its dict.
+
+        Args:
+            name: Parameter name
+            default: Returned if the parameter is unknown or missing
+
+        Returns:
+            Parameter value or default
+        """
+        param = self.schema.by_name.get(name)
+        if param is None:
+            return default
+        value = self._value(param)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        """Return value, unit and description of a parameter."""
+        param = self.schema.by_name[name]
+        value = self._value(param)
+        if value is None:
+            raise KeyError(name)
+        return {
+            "value": value,
+            "unit": param.unit,
+            "description": param.description,
+            "timestamp": self.timestamp,
+        }
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether a value is present for a parameter."""
+        param = self.schema.by_name.get(name)  # type: ignore[call-overload]
+        return param is not None and self._value(param) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over parameter names with a value."""
+        value_of = self._value
+        return (p.name for p in self.schema.parameters if value_of(p) is not None)
+
+    def __len__(self) -> int:
+        """Return the number of parameters with a value."""
+        return sum(1 for _ in self)
+
+
+def _parse_template(
+    firmware_version: str,
+    template: str,
+    descriptions: Mapping[str, dict[str, str]],
+    groups: Mapping[str, str],
+) -> FirmwareSchema:
+    """Parse XML firmware template and build parameter definitions.
+
+    Args:
+        firmware_version: Firmware version identifier
+        template: DAQPRJ XML template
+        descriptions: Bilingual parameter descriptions by name
+        groups: Publish groups by name (others are PARAMETER_GROUP_FAST)
+
+    Returns:
+        Firmware schema for the template
+    """
+    # Only needed without precompiled tables; keeps the module import light
+    import xml.etree.ElementTree as ET
+
+    parameters: dict[str, ParameterDefinition] = {}
+
+    try:
+        root = ET.fromstring(template)
+    except ET.ParseError as err:
+        _LOGGER.error("Failed to parse firmware template: %s", err)
+        raise
+
+    # Parse analog parameters
+    analog_count = 0
+    for channel in root.findall(".//ANALOG/CHANNEL"):
+        param_id = int(channel.get("id", 0))
+        param_name = channel.get("name", f"Unknown_{param_id}")
+        param_unit = channel.get("unit")
+        param_dop = channel.get("dop")
+
+        parameters[param_name] = ParameterDefinition(
+            name=param_name,
+            index=param_id,
+            unit=param_unit if param_unit else None,
+            is_digital=False,
+            decimals=int(param_dop) if param_dop else None,
+            description=descriptions.get(param_name),
+            group=groups.get(param_name, PARAMETER_GROUP_FAST),
+        )
+
+        analog_count = max(analog_count, param_id + 1)
+
+    # Parse digital parameters
+    digital_offset = analog_count
+    digital_count = 0
+
+    for channel in root.findall(".//DIGITAL/CHANNEL"):
+        param_id = int(channel.get("id", 0))
+        param_name = channel.get("name", f"Digital_{param_id}")
+        param_bit = int(channel.get("bit", 0))
+
+        parameters[param_name] = ParameterDefinition(
+            name=param_name,
+            index=digital_offset + param_id,
+            is_digital=True,
+            bit_mask=1 << param_bit,
+            description=descriptions.get(param_name),
+            group=groups.get(param_name, PARAMETER_GROUP_FAST),
+        )
+
+        digital_count = max(digital_count, param_id + 1)
+
+    _LOGGER.info(
+        "Parsed template for %s: %d analog + %d digital = %d total parameters",
+        firmware_version,
+        analog_count,
+        digital_count,
+        len(parameters),
+    )
+
+    return FirmwareSchema(
+        firmware_version,
+        tuple(parameters.values()),
+        analog_count,
+        digital_count,
+    )
+
+
+def compile_schema(schema: FirmwareSchema) -> dict[str, Any]:
+    """Serialize a firmware schema into its precompiled form.
+
+    Args:
+        schema: Firmware schema parsed from the XML template
+
+    Returns:
+        JSON-serializable tables as stored in COMPILED_TEMPLATES_DIR
+    """
+    analog_count = schema.analog_count
+    return {
+        "firmware": schema.firmware_version,
+        "analog_count": analog_count,
+        "digital_count": schema.digital_count,
+        "analog": [
+            [p.index, p.name, p.unit, p.decimals]
+            for p in schema.parameters
+            if not p.is_digital
+        ],
+        "digital": [
+            [p.index - analog_count, (p.bit_mask or 1).bit_length() - 1, p.name]
+            for p in schema.parameters
+            if p.is_digital
+        ],
+        "descriptions": {
+            p.name: p.description
+            for p in schema.parameters
+            if p.description != p.name
+        },
+        "groups": {
+            p.name: p.group
+            for p in schema.parameters
+            if p.group != PARAMETER_GROUP_FAST
+        },
+    }
+
+
+def _load_compiled(firmware_version: str) -> FirmwareSchema | None:
+    """Load the precompiled tables for a firmware version.
+
+    Args:
+        firmware_version: Firmware version identifier
+
+    Returns:
+        Firmware schema, or None if no precompiled tables exist
+    """
+    path = COMPILED_TEMPLATES_DIR / f"{firmware_version}.json"
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+    descriptions = data["descriptions"]
+    groups = data.get("groups", {})
+    analog_count = data["analog_count"]
+    parameters = [
+        ParameterDefinition(
+            name=name,
+            index=index,
+            unit=unit,
+            is_digital=False,
+            decimals=decimals,
+            description=descriptions.get(name),
+            group=groups.get(name, PARAMETER_GROUP_FAST),
+        )
+        for index, name, unit, decimals in data["analog"]
+    ]
+    parameters.extend(
+        ParameterDefinition(
+            name=name,
+            index=analog_count + word,
+            is_digital=True,
+            bit_mask=1 << bit,
+            description=descriptions.get(name),
+            group=groups.get(name, PARAMETER_GROUP_FAST),
+        )
+        for word, bit, name in data["digital"]
+    )
+
+    _LOGGER.debug(
+        "Loaded precompiled template for %s: %d parameters",
+        firmware_version,
+        len(parameters),
+    )
+
+    return FirmwareSchema(
+        firmware_version,
+        tuple(parameters),
+        analog_count,
+        data["digital_count"],
+    )
+
+
+def parse_firmware_template(firmware_version: str) -> FirmwareSchema:
+    """Parse a firmware version from the XML source in firmware_templates.py.
+
+    Imports the XML templates, description and group tables on demand; used when no
+    precompiled tables exist and by tools/compile_templates.py.
+
+    Args:
+        firmware_version: Firmware version identifier
+
+    Returns:
+        Firmware schema for the template
+
+    Raises:
+        HargassnerFirmwareError: If no template exists for the version
+    """
+    from .firmware_templates import (
+        FIRMWARE_TEMPLATES,
+        PARAMETER_DESCRIPTIONS,
+        PARAMETER_GROUPS,
+    )
+
+    template = FIRMWARE_TEMPLATES.get(firmware_version)
+    if template is None:
+        raise HargassnerFirmwareError(f"No template for firmware {firmware_version}")
+
+    return _parse_template(
+        firmware_version, template, PARAMETER_DESCRIPTIONS, PARAMETER_GROUPS
+    )
+
+
+@lru_cache(maxsize=None)
+def get_firmware_schema(firmware_version: str) -> FirmwareSchema:
+    """Return the shared schema for a firmware version.
+
+    Tables are loaded lazily from the precompiled artifact of this firmware
+    only, falling back to parsing the XML template. Later calls for the same
+    firmware (setup, options reload, config flow validation) hit the cache.
+    The first call reads a file; call it from an executor in the event loop.
+
+    Args:
+        firmware_version: Firmware version identifier
+
+    Returns:
+        Firmware schema, falling back to V14_1HAR_q1 for unknown versions
+    """
+    if firmware_version not in FIRMWARE_VERSIONS:
+        _LOGGER.error(
+            "Unknown firmware version: %s, using V14_1HAR_q1 as fallback",
+            firmware_version,
+        )
+        return get_firmware_schema("V14_1HAR_q1")
+
+    schema = _load_compiled(firmware_version)
+    if schema is None:
+        _LOGGER.debug("No precompiled template for %s, parsing XML", firmware_version)
+        schema = parse_firmware_template(firmware_version)
+    return schema
+
+
+def _is_plausible(param: ParameterDefinition, raw_value: str | bytes) -> bool:
+    """Return whether a raw token is a plausible value for a channel."""
+    try:
+        value = param.converter(raw_value)
+    except ValueError:
+        return False
+
+    if param.decimals == 0 and value != int(value):
+        return False
+
+    limits = _PLAUSIBLE_RANGES.get(param.unit or "")
+    return limits is None or limits[0] <= value <= limits[1]
+
+
+def score_firmware(schema: FirmwareSchema, values: list[str] | list[bytes]) -> float:
+    """Score how well message tokens match a firmware template.
+
+    Half of the score is an exact token count match, the other half the
+    share of channels whose token is plausible for the channel (integer
+    channels hold integers, temperatures and percentages are in range).
+
+    Args:
+        schema: Firmware schema to score against
+        values: Message tokens without the 'pm' prefix
+
+    Returns:
+        Score between 0.0 and 1.0
+    """
+    count = len(values)
+    plausible = 0
+
+    for param in schema.parameters:
+        if (
+            not param.is_digital
+            and param.index < count
+            and _is_plausible(param, values[param.index])
+        ):
+            plausible += 1
+
+    for index in range(schema.analog_count, min(count, schema.expected_length)):
+        try:
+            if int(values[index]) >= 0:
+                plausible += 1
+        except ValueError:
+            pass
+
+    checked = len(schema.plan_indices) + schema.digital_count
+    length_score = 1.0 if count == schema.expected_length else 0.0
+    return 0.5 * length_score + 0.5 * (plausible / checked if checked else 0.0)
+
+
+@lru_cache(maxsize=None)
+def _firmware_index() -> Mapping[int, tuple[str, ...]]:
+    """Index known firmware versions by message token count."""
+    index: dict[int, list[str]] = {}
+    for firmware_version in FIRMWARE_VERSIONS:
+        schema = get_firmware_schema(firmware_version)
+        index.setdefault(schema.expected_length, []).append(firmware_version)
+    return MappingProxyType({length: tuple(fws) for length, fws in index.items()})
+
+
+def load_firmware_tables(firmware_version: str) -> FirmwareSchema:
+    """Load the tables needed before the first frame is parsed.
+
+    Loads the schema of the configured firmware and the index used by
+    firmware detection, which reads the tables of all known firmware
+    versions. Both are cached; run this in an executor so the first
+    (detecting) parse on the event loop does no file I/O.
+
+    Args:
+        firmware_version: Configured firmware version
+
+    Returns:
+        Firmware schema of the configured firmware
+    """
+    _firmware_index()
+    return get_firmware_schema(firmware_version)
+
+
+def detect_firmware(values: list[str] | list[bytes]) -> tuple[str, float] | None:
+    """Find the known firmware template that best matches a message.
+
+    Templates with the same token count are scored first; if there is none,
+    all templates are scored.
+
+    Args:
+        values: Message tokens without the 'pm' prefix
+
+    Returns:
+        Best firmware version and its score, or None below FIRMWARE_DETECT_MIN_SCORE
+    """
+    index = _firmware_index()
+    candidates = index.get(len(values)) or tuple(FIRMWARE_VERSIONS)
+
+    best: tuple[str, float] | None = None
+    for firmware_version in candidates:
+        score = score_firmware(get_firmware_schema(firmware_version), values)
+        if best is None or score > best[1]:
+            best = (firmware_version, score)
+
+    if best is None or best[1] < FIRMWARE_DETECT_MIN_SCORE:
+        return None
+    return best
+
+
 class HargassnerMessageParser:
     """Parser for Hargassner telnet messages."""
 
-    def __init__(self, firmware_version: str) -> None:
+    def __init__(self, firmware_version: str, auto_detect: bool = True) -> None:
         """Initialize message parser.
 
         Args:
             firmware_version: Firmware version identifier
+            auto_detect: Switch templates if messages match another firmware
         """
         self._firmware_version = firmware_version
-        self._parameters: dict[str, ParameterDefinition] = {}
-        self._expected_length = 0
+        self._schema = get_firmware_schema(firmware_version)
 
-        # Parse firmware template
-        self._parse_template()
+        self._auto_detect = auto_detect
+        self._mismatch_count = 0
+        # Frame length for which detection found no better template
+        self._detect_failed_length: int | None = None
 
-    def _parse_template(self) -> None:
-        """Parse XML firmware template and build parameter definitions."""
-        template = FIRMWARE_TEMPLATES.get(self._firmware_version)
+        # Previous message, its tokens and frame for change detection
+        self._last_message: str | bytes | None = None
+        self._last_tokens: list[str] | list[bytes] = []
+        self._last_frame: HargassnerFrame | None = None
 
-        if not template:
-            _LOGGER.error(
-                "Unknown firmware version: %s, using V14_1HAR_q1 as fallback",
-                self._firmware_version,
-            )
-            template = FIRMWARE_TEMPLATES["V14_1HAR_q1"]
+        # Active parse plan (all channels unless subscriptions are set)
+        self._subscriptions: frozenset[str] | None = None
+        self._plan_names: tuple[str, ...] = ()
+        self._plan_indices: tuple[int, ...] = ()
+        self._plan_converters: tuple[Callable[[str | bytes], Any], ...] = ()
+        self._word_offsets: tuple[int, ...] = ()
+        self._compile_plan()
 
-        try:
-            root = ET.fromstring(template)
-
-            # Parse analog parameters
-            analog_count = 0
-            for channel in root.findall(".//ANALOG/CHANNEL"):
-                param_id = int(channel.get("id", 0))
-                param_name = channel.get("name", f"Unknown_{param_id}")
-                param_unit = channel.get("unit")
-
-                self._parameters[param_name] = ParameterDefinition(
-                    name=param_name,
-                    index=param_id,
-                    unit=param_unit if param_unit else None,
-                    is_digital=False,
-                )
+    def set_subscriptions(self, names: Iterable[str] | None) -> None:
+        """Restrict parsing to the given channels.
 
-                analog_count = max(analog_count, param_id + 1)
+        Channels not subscribed are not converted and read as missing. The
+        change detection state is reset so newly subscribed channels are
+        converted (and reported as changed) on the next message.
 
-            # Parse digital parameters
-            digital_offset = analog_count
-            digital_count = 0
+        Args:
+            names: Parameter names to convert, or None for all channels
+        """
+        subscriptions = None if names is None else frozenset(names)
+        if subscriptions == self._subscriptions:
+            return
+        self._subscriptions = subscriptions
+        self._compile_plan()
 
-            for channel in root.findall(".//DIGITAL/CHANNEL"):
-                param_id = int(channel.get("id", 0))
-                param_name = channel.get("name", f"Digital_{param_id}")
-                param_bit = int(channel.get("bit", 0))
+    def _compile_plan(self) -> None:
+        """Build the active parse plan from the schema and subscriptions."""
+        schema = self._schema
+        subscriptions = self._subscriptions
 
-                self._parameters[param_name] = ParameterDefinition(
-                    name=param_name,
-                    index=digital_offset + param_id,
-                    is_digital=True,
-                    bit_mask=1 << param_bit,
+        if subscriptions is None:
+            self._plan_names = schema.plan_names
+            self._plan_indices = schema.plan_indices
+            self._plan_converters = schema.plan_converters
+            self._word_offsets = tuple(range(schema.digital_count))
+        else:
+            plan = [
+                column
+                for column in zip(
+                    schema.plan_names, schema.plan_indices, schema.plan_converters
+                )
+                if column[0] in subscriptions
+            ]
+            self._plan_names = tuple(column[0] for column in plan)
+            self._plan_indices = tuple(column[1] for column in plan)
+            self._plan_converters = tuple(column[2] for column in plan)
+            self._word_offsets = tuple(
+                sorted(
+                    {
+                        offset
+                        for name, offset in zip(
+                            schema.digital_names, schema.digital_offsets
+                        )
+                        if name in subscriptions
+                    }
                 )
+            )
 
-                digital_count = max(digital_count, param_id + 1)
+        _LOGGER.debug(
+            "Parsing %d analog channels and %d digital words",
+            len(self._plan_indices),
+            len(self._word_offsets),
+        )
 
-            self._expected_length = analog_count + digital_count
+        self._last_message = None
+        self._last_tokens = []
+        self._last_frame = None
 
-            _LOGGER.info(
-                "Parsed template for %s: %d analog + %d digital = %d total parameters",
-                self._firmware_version,
-                analog_count,
-                digital_count,
-                len(self._parameters),
-            )
+    def _check_firmware(self, values: list[str] | list[bytes]) -> None:
+        """Switch to a better matching template after repeated mismatches.
 
-        except ET.ParseError as err:
-            _LOGGER.error("Failed to parse firmware template: %s", err)
-            raise
+        Detection is not repeated for a frame length it already failed on.
+
+        Args:
+            values: Message tokens without the 'pm' prefix
+        """
+        if len(values) == self._schema.expected_length:
+            self._mismatch_count = 0
+            return
+        if len(values) == self._detect_failed_length:
+            # Scoring every template again would not find a better one
+            return
 
-    def parse_message(self, message: str) -> dict[str, Any] | None:
+        self._mismatch_count += 1
+        if self._mismatch_count < FIRMWARE_DETECT_FRAMES:
+            return
+        self._mismatch_count = 0
+
+        detected = detect_firmware(values)
+        if (
+            detected is None
+            or detected[0] == self._schema.firmware_version
+            or detected[1] <= score_firmware(self._schema, values)
+        ):
+            self._detect_failed_length = len(values)
+            return
+
+        firmware_version, score = detected
+
+        _LOGGER.warning(
+            "Messages match firmware %s (score %.2f), not %s; "
+            "switching parser tables. Reconfigure the integration to update "
+            "the firmware setting",
+            firmware_version,
+            score,
+            self._schema.firmware_version,
+        )
+        self._schema = get_firmware_schema(firmware_version)
+        self._detect_failed_length = None
+        self._compile_plan()
+
+    def parse_message(self, message: str) -> HargassnerFrame | None:
         """Parse a telnet message line.
 
+        Only channels whose raw token differs from the previous message are
+        converted again; a message identical to the previous one returns the
+        previous state with an empty change set.
+
         Args:
             message: Raw message line from telnet (starting with 'pm')
 
         Returns:
-            Dictionary with parsed parameters, or None if parsing failed
+            Frame with parsed parameters, or None if parsing failed
         """
+        message = message.strip()
+
+        if (
+            self._last_frame is not None
+            and message == self._last_message
+            and not self._mismatch_count
+        ):
+            return self._last_frame.unchanged()
+
         # Remove 'pm' prefix and split into values
-        parts = message.strip().split()
+        parts = message.split()
 
         if not parts or parts[0] != "pm":
             _LOGGER.debug("Message does not start with 'pm': %s", message[:50])
             return None
 
-        values = parts[1:]  # Skip 'pm' prefix
+        self._last_message = message
+        return self._parse_values(parts[1:])  # Skip 'pm' prefix
+
+    def parse_bytes(self, data: bytes | bytearray | memoryview) -> HargassnerFrame | None:
+        """Parse a raw telnet message line without decoding it to text.
+
+        Numeric tokens are plain ASCII, so they are split and converted as
+        bytes; text is only decoded for the debug log of rejected lines.
+
+        Args:
+            data: Raw message line from telnet (starting with b'pm')
+
+        Returns:
+            Frame with parsed parameters, or None if parsing failed
+        """
+        message = bytes(data).strip()
+
+        if (
+            self._last_frame is not None
+            and message == self._last_message
+            and not self._mismatch_count
+        ):
+            return self._last_frame.unchanged()
+
+        parts = message.split()
+
+        if not parts or parts[0] != b"pm":
+            _LOGGER.debug(
+                "Message does not start with 'pm': %s",
+                message[:50].decode("utf-8", errors="replace"),
+            )
+            return None
+
+        self._last_message = message
+        return self._parse_values(parts[1:])  # Skip b'pm' prefix
+
+    def parse_many(
+        self,
+        lines: Iterable[str | bytes],
+        chunk_size: int = 10000,
+    ) -> ParsedBatch:
+        """Parse a batch of telnet message lines into NumPy arrays.
+
+        Intended for offline work (replays, DAQ analysis); requires numpy.
+        Lines not starting with 'pm' are skipped, short lines are padded
+        with NaN (analog) or cleared bits (digital). The parser's change
+        detection state is not touched.
+
+        Args:
+            lines: Raw message lines (str or bytes)
+            chunk_size: Number of lines converted per vectorized step
+
+        Returns:
+            Float matrix with one column per analog channel and boolean matrix
+            with one column per digital channel, plus their column names
+
+        Raises:
+            HargassnerParseError: If numpy is not installed
+        """
+        try:
+            import numpy as np
+        except ImportError as err:
+            raise HargassnerParseError("parse_many requires numpy") from err
+
+        schema = self._schema
+        width = schema.expected_length
+        analog_columns = np.array(schema.plan_indices, dtype=np.intp)
+        word_columns = np.array(schema.digital_offsets, dtype=np.intp)
+        bit_shifts = np.array(schema.digital_bits, dtype=np.int64)
+
+        analog_chunks = []
+        digital_chunks = []
+        rows: list[bytes] = []
+
+        def _flush() -> None:
+            """Convert the collected rows in one vectorized step."""
+            with warnings.catch_warnings():
+                # Malformed tokens stop the scan early; handled below
+                warnings.simplefilter("ignore", DeprecationWarning)
+                numeric = np.fromstring(b" ".join(rows), dtype=np.float64, sep=" ")
+            if numeric.size != len(rows) * width:
+                # Some row has malformed or a wrong number of tokens
+                numeric = np.full((len(rows), width), np.nan)
+                for index, row in enumerate(rows):
+                    values = _to_floats(row.split()[:width])
+                    numeric[index, : len(values)] = values
+            numeric = numeric.reshape(len(rows), width)
+            rows.clear()
+
+            analog_chunks.append(numeric[:, analog_columns])
+            words = numeric[:, schema.analog_count : width]
+            words = np.nan_to_num(words, nan=0.0).astype(np.int64)
+            digital_chunks.append(
+                ((words[:, word_columns] >> bit_shifts) & 1).astype(bool)
+            )
+
+        for line in lines:
+            if isinstance(line, str):
+                line = line.encode("utf-8")
+            line = line.strip()
+            if not line.startswith(b"pm"):
+                continue
+
+            if (
+                line.count(b" ") == width
+                and line[2:3] == b" "
+                and b"  " not in line
+            ):
+                # Exactly width single-spaced tokens: hand them over as-is
+                rows.append(line[3:])
+            else:
+                parts = line.split()
+                if parts[0] != b"pm":
+                    continue
+                values = parts[1 : width + 1]
+                values += [b"nan"] * (width - len(values))
+                rows.append(b" ".join(values))
+
+            if len(rows) >= chunk_size:
+                _flush()
+
+        if rows:
+            _flush()
+
+        if analog_chunks:
+            analog = np.concatenate(analog_chunks)
+            digital = np.concatenate(digital_chunks)
+        else:
+            analog = np.empty((0, len(schema.plan_indices)), dtype=np.float64)
+            digital = np.empty((0, len(schema.digital_names)), dtype=bool)
+
+        return ParsedBatch(analog, digital, schema.plan_names, schema.digital_names)
+
+    def _parse_values(self, values: list[str] | list[bytes]) -> HargassnerFrame:
+        """Convert message tokens into a frame, reusing unchanged channels.
+
+        Args:
+            values: Message tokens (str or ASCII bytes) without the 'pm' prefix
+
+        Returns:
+            Frame with parsed parameters and the set of changed channel indexes
+        """
+        if self._auto_detect:
+            self._check_firmware(values)
+
+        schema = self._schema
 
         # Check message length
-        if len(values) != self._expected_length:
+        if len(values) != schema.expected_length:
             _LOGGER.debug(
                 "Message length mismatch: expected %d, got %d",
-                self._expected_length,
+                schema.expected_length,
                 len(values),
             )
             # Don't fail completely - try to parse what we can
             # return None
 
-        # Parse all parameters
-        parsed_data: dict[str, Any] = {}
+        last_frame = self._last_frame
+        last_tokens = self._last_tokens
+        if last_frame is None:
+            analog: list[Any] = [None] * schema.analog_count
+            last_words: tuple[int | None, ...] = (None,) * schema.digital_count
+        else:
+            analog = list(last_frame.values)
+            last_words = last_frame.digital_words
+
+        count = len(values)
+        last_count = len(last_tokens)
+        changed: set[int] = set()
+
+        # Convert changed analog channels in one pass over the active plan
+        for name, index, convert in zip(
+            self._plan_names,
+            self._plan_indices,
+            self._plan_converters,
+        ):
+            raw_value = values[index] if index < count else None
+            if (
+                last_frame is not None
+                and raw_value == (last_tokens[index] if index < last_count else None)
+            ):
+                continue
+
+            changed.add(index)
+            if raw_value is None:
+                analog[index] = None
+                continue
+
+            try:
+                analog[index] = convert(raw_value)
+            except ValueError as err:
+                analog[index] = None
+                _LOGGER.debug(
+                    "Failed to parse value for %s at index %d: %s",
+                    name,
+                    index,
+                    err,
+                )
+
+        # Decode each changed digital word once; bits are read from the integer
+        words = list(last_words)
+        flips = [0] * schema.digital_count
+        for offset in self._word_offsets:
+            index = schema.analog_count + offset
+            raw_word = values[index] if index < count else None
+            if (
+                last_frame is not None
+                and raw_word == (last_tokens[index] if index < last_count else None)
+            ):
+                continue
 
-        for param_name, param_def in self._parameters.items():
-            value = param_def.parse_value(values)
+            word: int | None = None
+            if raw_word is not None:
+                try:
+                    word = int(raw_word)
+                except ValueError as err:
+                    _LOGGER.debug(
+                        "Failed to parse digital word %d: %s",
+                        offset,
+                        err,
+                    )
 
-            if value is not None:
-                parsed_data[param_name] = {
-                    "value": value,
-                    "unit": param_def.unit,
-                    "description": param_def.description,
-                }
+            last_word = last_words[offset]
+            if word != last_word:
+                words[offset] = word
+                flips[offset] = (word or 0) ^ (last_word or 0)
+                changed.add(index)
 
-        return parsed_data
+        frame = HargassnerFrame(
+            schema,
+            analog,
+            tuple(words),
+            tuple(flips),
+            frozenset(changed),
+        )
+        self._last_frame = frame
+        self._last_tokens = values
+        return frame
+
+    @property
+    def schema(self) -> FirmwareSchema:
+        """Return the shared firmware schema."""
+        return self._schema
+
+    @property
+    def firmware_version(self) -> str:
+        """Return the firmware version of the active template."""
+        return self._schema.firmware_version
+
+    @property
+    def subscriptions(self) -> frozenset[str] | None:
+        """Return the subscribed channel names (None means all)."""
+        return self._subscriptions
 
     @property
     def expected_length(self) -> int:
         """Return expected message length."""
-        return self._expected_length
+        return self._schema.expected_length
 
     @property
     def parameters(self) -> list[ParameterDefinition]:
         """Return all parameter definitions as list."""
-        return list(self._parameters.values())
+        return list(self._schema.parameters)
 
     def get_parameter_info(self, name: str) -> ParameterDefinition | None:
         """Get parameter definition by name.
@@ -213,4 +1172,4 @@ class HargassnerMessageParser:
         Returns:
             Parameter definition or None if not found
         """
-        return self._parameters.get(name)
+        return self._schema.by_name.get(name)
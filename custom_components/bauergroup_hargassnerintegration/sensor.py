@@ -158,6 +158,9 @@ class HargassnerBaseSensor(CoordinatorEntity, SensorEntity):
 
     _attr_has_entity_name = True
 
+    # Boiler channels this sensor reads; only these are parsed
+    _channels: tuple[str, ...] = ()
+
     def __init__(
         self,
         coordinator: HargassnerDataUpdateCoordinator,
@@ -175,6 +178,19 @@ class HargassnerBaseSensor(CoordinatorEntity, SensorEntity):
             configuration_url=f"http://{entry.data.get('host', '')}",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the channels this sensor reads.
+
+        The channels are also the coordinator context, so the sensor is
+        only updated when one of them changed.
+        """
+        self.coordinator_context = self._channels or None
+        await super().async_added_to_hass()
+        if self._channels:
+            self.async_on_remove(
+                self.coordinator.async_subscribe_channels(self._channels)
+            )
+
 
 class HargassnerConnectionSensor(HargassnerBaseSensor):
     """Sensor representing connection status."""
@@ -210,14 +226,26 @@ class HargassnerConnectionSensor(HargassnerBaseSensor):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        stats = self.coordinator.telnet_client.statistics
+        info = self.coordinator.telnet_client.connection_info
+        stats = info.statistics
         return {
             "messages_received": stats.get("messages_received", 0),
             "messages_parsed": stats.get("messages_parsed", 0),
             "parse_errors": stats.get("parse_errors", 0),
+            "frames_coalesced": stats.get("frames_coalesced", 0),
             "reconnections": stats.get("reconnections", 0),
+            "stale_reconnects": stats.get("stale_reconnects", 0),
+            "parse_seconds": round(stats.get("parse_seconds", 0.0), 3),
+            "parse_seconds_offloaded": round(stats.get("parse_seconds_offloaded", 0.0), 3),
+            "frame_period": round(stats.get("frame_period", 0.0), 3),
+            "frames_late": stats.get("frames_late", 0),
+            "frames_missed": stats.get("frames_missed", 0),
+            "publish_latency": stats.get("publish_latency"),
+            "standby_state": stats.get("standby_state"),
+            "failovers": stats.get("failovers", 0),
+            "failover_latency": stats.get("failover_latency"),
             "last_error": stats.get("last_error"),
-            "last_update": self.coordinator.telnet_client.last_update,
+            "last_update": info.last_update,
         }
 
 
@@ -226,6 +254,7 @@ class HargassnerStateSensor(HargassnerBaseSensor):
 
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_icon = "mdi:fireplace"
+    _channels = ("ZK",)
 
     def __init__(
         self,
@@ -275,6 +304,7 @@ class HargassnerErrorSensor(HargassnerBaseSensor):
 
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_icon = "mdi:alert"
+    _channels = ("Störung", "Störungs Nr")
 
     def __init__(
         self,
@@ -343,6 +373,7 @@ class HargassnerParameterSensor(HargassnerBaseSensor):
         """Initialize parameter sensor."""
         super().__init__(coordinator, entry)
         self._param_key = param_key
+        self._channels = (param_key,)
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{param_key}"
         self._attr_device_class = device_class
@@ -384,6 +415,7 @@ class HargassnerEnergySensor(HargassnerBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_icon = "mdi:radiator"
+    _channels = ("Verbrauchszähler",)
 
     def __init__(
         self,
@@ -2,26 +2,52 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import random
 import socket
-from asyncio import StreamReader, StreamWriter
-from collections.abc import Callable
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
 from .const import (
-    TELNET_BUFFER_SIZE,
+    CALLBACK_POLICY_CONFLATE,
+    CALLBACK_QUEUE_SIZE,
+    TELNET_FRAME_LATE_FACTOR,
+    TELNET_FRAME_PERIOD,
     TELNET_MAX_RECONNECT_DELAY,
     TELNET_PORT,
     TELNET_RECONNECT_DELAY,
-    TELNET_TIMEOUT,
+    TELNET_STALE_FRAMES,
+    TELNET_STANDBY_RETRY_DELAY,
+    TELNET_STALE_MIN_TIMEOUT,
+    TELNET_START_TIMEOUT,
+    TRANSPORT_BUFFERED,
+    TRANSPORT_STREAM,
 )
-from .exceptions import HargassnerConnectionError, HargassnerTimeoutError
-from .types import ParameterData, StatisticsData
-from .message_parser import HargassnerMessageParser
+from .capture import FrameCapture
+from .exceptions import (
+    HargassnerConnectionError,
+    HargassnerEndOfDataError,
+    HargassnerTimeoutError,
+)
+from .fanout import CallbackSubscriber
+from .message_parser import HargassnerFrame, HargassnerMessageParser
+from .transport import BufferedProtocolTransport, HargassnerTransport, StreamTransport
+from .types import ConnectionInfo, StatisticsData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Frame intervals measured before late/missed frames are counted
+_PERIOD_WARMUP = 5
+
+# Intervals enter the period estimate capped at this many periods, so gaps
+# do not inflate it while a genuinely slower boiler is still followed
+_PERIOD_SAMPLE_LIMIT = 4.0
+
 
 class HargassnerTelnetClient:
     """Thread-safe telnet client with automatic reconnection."""
@@ -31,6 +57,11 @@ class HargassnerTelnetClient:
         host: str,
         firmware_version: str,
         port: int = TELNET_PORT,
+        transport: str = TRANSPORT_STREAM,
+        parse_in_executor: bool = False,
+        hot_standby: bool = False,
+        capture: FrameCapture | None = None,
+        transport_factory: Callable[[], HargassnerTransport] | None = None,
     ) -> None:
         """Initialize the telnet client.
 
@@ -38,27 +69,62 @@ class HargassnerTelnetClient:
             host: IP address or hostname of the boiler
             firmware_version: Firmware version identifier (e.g., V14_1HAR_q1)
             port: Telnet port (default: 23)
+            transport: Receive path, TRANSPORT_STREAM or TRANSPORT_BUFFERED
+            parse_in_executor: Parse frames on a worker thread instead of
+                the event loop
+            hot_standby: Keep a second connection warm for failover (only
+                used if the boiler serves more than one client)
+            capture: Optional recorder for every raw pm line received
+            transport_factory: Optional function creating the transport
+                instead of ``transport``, e.g. a ReplayTransport
         """
         self._host = host
         self._port = port
         self._firmware_version = firmware_version
 
         # Connection state
-        self._reader: StreamReader | None = None
-        self._writer: StreamWriter | None = None
+        self._transport_kind = transport
+        self._transport_factory = transport_factory
+        self._transport = self._create_transport(transport)
         self._connected = False
+        self._connected_event = asyncio.Event()
         self._running = False
 
+        # Raw frame capture, fed by the primary transport only
+        self._capture = capture
+        if capture is not None:
+            self._transport.line_sink = capture.add
+
+        # Frame counters of transports replaced by failover
+        self._frames_base = 0
+        self._coalesced_base = 0
+
+        # Hot standby connection
+        self._hot_standby = hot_standby
+        self._standby: HargassnerTransport | None = None
+        self._standby_task: asyncio.Task | None = None
+        self._standby_last_frame = 0.0
+        self._standby_supported: bool | None = None
+        self._failover_started: float | None = None
+
+        # Stale-stream watchdog (event loop time)
+        self._watchdog_since = 0.0
+        self._last_frame_at: float | None = None
+        self._frame_period = TELNET_FRAME_PERIOD
+        self._intervals_seen = 0
+        self._coalesced_seen = 0
+
         # Background tasks
         self._receiver_task: asyncio.Task | None = None
         self._reconnect_delay = TELNET_RECONNECT_DELAY
 
-        # Message parser
+        # Message parser, optionally driven by a dedicated worker thread
         self._parser = HargassnerMessageParser(firmware_version)
+        self._parse_in_executor = parse_in_executor
+        self._executor: ThreadPoolExecutor | None = None
 
-        # Data storage
-        self._latest_data: dict[str, ParameterData] = {}
-        self._data_lock = asyncio.Lock()
+        # Latest snapshot, replaced as a whole on every publication
+        self._latest_data: HargassnerFrame | None = None
         self._last_update: datetime | None = None
 
         # Statistics
@@ -66,12 +132,25 @@ class HargassnerTelnetClient:
             "messages_received": 0,
             "messages_parsed": 0,
             "parse_errors": 0,
+            "frames_coalesced": 0,
             "reconnections": 0,
+            "stale_reconnects": 0,
+            "parse_seconds": 0.0,
+            "parse_seconds_offloaded": 0.0,
+            "sequence": 0,
+            "frame_interval": None,
+            "frame_period": TELNET_FRAME_PERIOD,
+            "frames_late": 0,
+            "frames_missed": 0,
+            "publish_latency": None,
+            "standby_state": "connecting" if hot_standby else "off",
+            "failovers": 0,
+            "failover_latency": None,
             "last_error": None,
         }
 
-        # Callbacks
-        self._data_callbacks: list[Callable[[dict[str, ParameterData]], None]] = []
+        # Callbacks, each with its own bounded queue
+        self._subscribers: dict[Callable, CallbackSubscriber[HargassnerFrame]] = {}
 
     async def async_start(self) -> None:
         """Start the telnet client and background receiver task."""
@@ -82,18 +161,49 @@ class HargassnerTelnetClient:
         _LOGGER.debug("Starting telnet client for %s:%d", self._host, self._port)
         self._running = True
 
+        if self._capture is not None:
+            await self._capture.async_start()
+
+        # A single worker keeps all parser access serialized
+        if self._parse_in_executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="hargassner_parser"
+            )
+
         # Start receiver task
         self._receiver_task = asyncio.create_task(self._receiver_loop())
 
         # Wait for initial connection
-        for _ in range(50):  # 5 seconds max
-            if self._connected:
-                _LOGGER.debug("Initial connection established")
-                return
-            await asyncio.sleep(0.1)
+        if await self.async_wait_connected(TELNET_START_TIMEOUT):
+            _LOGGER.debug("Initial connection established")
+            return
 
         _LOGGER.warning("Initial connection not established within timeout")
 
+    async def async_wait_connected(self, timeout: float) -> bool:
+        """Wait until the connection to the boiler is established.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if connected, False if the timeout expired
+        """
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def async_wait_finished(self) -> None:
+        """Wait until the receiver loop has ended.
+
+        The loop only ends on its own when a replay transport runs out of
+        frames; otherwise this waits until async_stop() is called.
+        """
+        if self._receiver_task is not None:
+            await asyncio.wait({self._receiver_task})
+
     async def async_stop(self) -> None:
         """Stop the telnet client and cleanup resources."""
         _LOGGER.debug("Stopping telnet client")
@@ -107,67 +217,309 @@ class HargassnerTelnetClient:
             except asyncio.CancelledError:
                 pass
 
+        # Stop hot standby
+        await self._async_stop_standby()
+
+        # Stop callback delivery
+        for subscriber in self._subscribers.values():
+            subscriber.cancel()
+
+        # Stop parser worker
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         # Close connection
         await self._close_connection()
 
+        # Write remaining captured frames
+        if self._capture is not None:
+            await self._capture.async_stop()
+
+    def _create_transport(self, transport: str) -> HargassnerTransport:
+        """Create the transport for the configured receive path.
+
+        Args:
+            transport: TRANSPORT_STREAM or TRANSPORT_BUFFERED
+
+        Returns:
+            Transport instance (reused across reconnects)
+        """
+        if self._transport_factory is not None:
+            return self._transport_factory()
+        if transport == TRANSPORT_BUFFERED:
+            return BufferedProtocolTransport(self._host, self._port)
+        return StreamTransport(self._host, self._port)
+
     async def _receiver_loop(self) -> None:
         """Background loop that receives and processes telnet messages."""
+        loop = asyncio.get_running_loop()
         while self._running:
             try:
                 # Ensure connection
                 if not self._connected:
                     await self._connect()
+                    self._watchdog_since = loop.time()
+                    self._last_frame_at = None
+
+                # Reconnect if no valid frame arrived for N frame periods
+                stale_timeout = self._stale_timeout()
+                remaining = self._watchdog_since + stale_timeout - loop.time()
+                if remaining <= 0:
+                    _LOGGER.warning(
+                        "No valid frame for %.0f s, reconnecting", stale_timeout
+                    )
+                    self._stats["stale_reconnects"] += 1
+                    self._stats["last_error"] = f"No valid frame for {stale_timeout:.0f} s"
+                    await self._async_recover()
+                    continue
 
-                # Read data
-                if self._reader:
-                    try:
-                        data = await asyncio.wait_for(
-                            self._reader.read(TELNET_BUFFER_SIZE),
-                            timeout=TELNET_TIMEOUT,
-                        )
+                # Wait for the newest complete frame
+                try:
+                    line = await self._transport.async_read_frame(remaining)
+                except HargassnerEndOfDataError as err:
+                    _LOGGER.info("%s, stopping receiver", err)
+                    self._running = False
+                    await self._close_connection()
+                    break
+                except HargassnerConnectionError as err:
+                    _LOGGER.warning("%s", err)
+                    self._stats["last_error"] = str(err)
+                    await self._async_recover()
+                    continue
 
-                        if not data:
-                            _LOGGER.warning("Connection closed by server")
-                            self._connected = False
-                            continue
+                sequence = self._frames_base + self._transport.frames
+                self._stats["messages_received"] = sequence
+                self._stats["frames_coalesced"] = self._coalesced_base + self._transport.coalesced
+                if line is None:
+                    # Read deadline reached; the watchdog check decides
+                    continue
+                received = loop.time()
+                received_time = datetime.now(timezone.utc)
+
+                if self._executor is not None:
+                    # Copy first: views into the receive buffer expire on await
+                    parsed_data = await self._async_parse_offloaded(bytes(line))
+                else:
+                    parsed_data = self._parse_line(line)
+                if parsed_data is None:
+                    continue
 
-                        # Process received data
-                        await self._process_data(data)
+                parsed_data.stamp(sequence, received, received_time)
+                self._track_frame(received)
+                self._publish(parsed_data, received_time)
 
-                        # Reset reconnect delay on successful receive
-                        self._reconnect_delay = TELNET_RECONNECT_DELAY
+                if self._failover_started is not None:
+                    self._stats["failover_latency"] = received - self._failover_started
+                    self._failover_started = None
 
-                    except asyncio.TimeoutError:
-                        # Timeout is normal, just continue
-                        continue
+                # Reset reconnect delay on successful receive
+                self._reconnect_delay = TELNET_RECONNECT_DELAY
 
             except Exception as err:
                 _LOGGER.error("Error in receiver loop: %s", err, exc_info=True)
                 self._stats["last_error"] = str(err)
-                self._connected = False
-                await self._close_connection()
+                await self._async_recover()
+
+    def _stale_timeout(self) -> float:
+        """Return seconds without a valid frame after which a stream is stale."""
+        return max(TELNET_STALE_FRAMES * self._frame_period, TELNET_STALE_MIN_TIMEOUT)
+
+    async def _async_recover(self) -> None:
+        """Fail over to the hot standby, or reconnect after a backoff."""
+        if await self._async_failover():
+            return
+        await self._close_connection()
+        await self._async_backoff()
+
+    async def _async_failover(self) -> bool:
+        """Promote a healthy standby connection to primary.
+
+        Returns:
+            True if the standby took over
+        """
+        standby = self._standby
+        loop = asyncio.get_running_loop()
+        if standby is None or (
+            loop.time() - self._standby_last_frame > self._stale_timeout()
+        ):
+            return False
+
+        self._failover_started = loop.time()
+        previous = self._transport
+
+        # Keep sequence numbers and counters continuous across transports
+        self._frames_base += previous.frames - standby.frames
+        self._coalesced_base += previous.coalesced - standby.coalesced
+        self._transport = standby
+        self._standby = None
+        standby.line_sink, previous.line_sink = previous.line_sink, None
+        self._coalesced_seen = self._coalesced_base + standby.coalesced
+
+        # The standby task stops reading once it sees its transport promoted
+        await self._async_stop_standby()
+        await previous.async_close()
+
+        self._watchdog_since = loop.time()
+        self._stats["failovers"] += 1
+        _LOGGER.warning("Switched over to hot standby connection")
+
+        self._start_standby()
+        return True
+
+    def _start_standby(self) -> None:
+        """Start maintaining a hot standby connection if enabled."""
+        if (
+            not self._hot_standby
+            or self._standby_supported is False
+            or (self._standby_task is not None and not self._standby_task.done())
+        ):
+            return
+        self._standby_task = asyncio.create_task(self._standby_loop())
+
+    async def _async_stop_standby(self) -> None:
+        """Stop the standby task and close an unpromoted standby connection."""
+        task, self._standby_task = self._standby_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._standby is not None:
+            await self._standby.async_close()
+            self._standby = None
+
+    async def _standby_loop(self) -> None:
+        """Keep a second connection open and drained, retrying when it fails."""
+        while self._running and self._standby_supported is not False:
+            transport = self._create_transport(self._transport_kind)
+            self._stats["standby_state"] = "connecting"
+            try:
+                await self._async_run_standby(transport)
+            except (HargassnerConnectionError, HargassnerTimeoutError) as err:
+                _LOGGER.debug("Hot standby connection lost: %s", err)
+            except (asyncio.TimeoutError, OSError) as err:
+                _LOGGER.debug("Hot standby connection failed: %s", err)
+            except Exception as err:
+                _LOGGER.error("Error in hot standby loop: %s", err, exc_info=True)
+            finally:
+                if transport is not self._transport:
+                    if self._standby is transport:
+                        self._standby = None
+                    await transport.async_close()
+
+            if transport is self._transport:
+                # Promoted to primary by a failover
+                return
+            if self._standby_supported is False:
+                self._stats["standby_state"] = "unsupported"
+                return
+            self._stats["standby_state"] = "connecting"
+            await asyncio.sleep(TELNET_STANDBY_RETRY_DELAY)
+
+    async def _async_run_standby(self, transport: HargassnerTransport) -> None:
+        """Open a standby connection and drain it until it fails.
+
+        The standby is only used if the boiler sends frames on both
+        connections at once; otherwise hot standby is disabled.
+
+        Args:
+            transport: Fresh transport for the standby connection
+        """
+        loop = asyncio.get_running_loop()
+        opened = loop.time()
+        await transport.async_open()
+        timeout = self._stale_timeout()
+
+        try:
+            # Both connections must deliver frames after the standby attached
+            while True:
+                if await transport.async_read_frame(timeout) is None:
+                    raise HargassnerTimeoutError("No frame on second connection")
+                if self._last_frame_at is not None and self._last_frame_at > opened:
+                    break
+                if loop.time() - opened > timeout:
+                    raise HargassnerTimeoutError("Primary starved by second connection")
+        except (HargassnerConnectionError, HargassnerTimeoutError) as err:
+            _LOGGER.info("Boiler does not serve a second client, hot standby disabled (%s)", err)
+            self._standby_supported = False
+            return
 
-                # Exponential backoff for reconnection
-                await asyncio.sleep(self._reconnect_delay)
-                self._reconnect_delay = min(
-                    self._reconnect_delay * 2,
-                    TELNET_MAX_RECONNECT_DELAY,
-                )
+        self._standby_supported = True
+        self._standby = transport
+        self._standby_last_frame = loop.time()
+        self._stats["standby_state"] = "ready"
+        _LOGGER.debug("Hot standby connection established")
+
+        # Stop as soon as a failover promoted the transport, even if the
+        # cancellation was lost in a read that completed at the same time
+        while self._standby is transport:
+            if await transport.async_read_frame(timeout) is None:
+                raise HargassnerTimeoutError("Standby connection stale")
+            self._standby_last_frame = loop.time()
+
+    def _track_frame(self, now: float) -> None:
+        """Feed the watchdog and track frame intervals.
+
+        A frame arriving later than TELNET_FRAME_LATE_FACTOR periods after
+        the previous one is counted as late; whole periods in the gap that
+        were not coalesced by the transport are counted as missed, i.e. the
+        boiler or the network did not deliver them.
+
+        Args:
+            now: Event loop time the frame was received
+        """
+        coalesced = self._coalesced_base + self._transport.coalesced
+        if self._last_frame_at is not None:
+            interval = now - self._last_frame_at
+            period = self._frame_period
+            if self._intervals_seen == 0:
+                period = interval
+            elif self._intervals_seen >= _PERIOD_WARMUP and (
+                interval > TELNET_FRAME_LATE_FACTOR * period
+            ):
+                self._stats["frames_late"] += 1
+                missed = round(interval / period) - 1 - (coalesced - self._coalesced_seen)
+                if missed > 0:
+                    self._stats["frames_missed"] += missed
+
+            period += 0.1 * (min(interval, _PERIOD_SAMPLE_LIMIT * period) - period)
+            self._frame_period = period
+            self._intervals_seen += 1
+            self._stats["frame_interval"] = interval
+            self._stats["frame_period"] = period
+
+        self._coalesced_seen = coalesced
+        self._last_frame_at = now
+        self._watchdog_since = now
+
+    async def _async_backoff(self) -> None:
+        """Sleep before reconnecting, with exponential backoff and jitter.
+
+        The delay is drawn from the upper half of the current backoff step so
+        that several clients do not reconnect in lockstep.
+        """
+        await asyncio.sleep(
+            random.uniform(self._reconnect_delay / 2, self._reconnect_delay)
+        )
+        self._reconnect_delay = min(
+            self._reconnect_delay * 2,
+            TELNET_MAX_RECONNECT_DELAY,
+        )
 
     async def _connect(self) -> None:
         """Establish telnet connection to the boiler."""
         try:
             _LOGGER.debug("Connecting to %s:%d", self._host, self._port)
 
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port),
-                timeout=TELNET_TIMEOUT,
-            )
+            await self._transport.async_open()
 
             self._connected = True
+            self._connected_event.set()
             self._stats["reconnections"] += 1
             _LOGGER.debug("Connected to boiler")
 
+            self._start_standby()
+
         except asyncio.TimeoutError as err:
             _LOGGER.error("Connection timeout: %s", err)
             self._stats["last_error"] = f"Connection timeout: {err}"
@@ -179,105 +531,159 @@ class HargassnerTelnetClient:
 
     async def _close_connection(self) -> None:
         """Close the telnet connection."""
-        if self._writer:
-            try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except Exception as err:
-                _LOGGER.debug("Error closing connection: %s", err)
-            finally:
-                self._writer = None
-                self._reader = None
-
+        await self._transport.async_close()
         self._connected = False
+        self._connected_event.clear()
+
+    def _parse_timed(
+        self, line: bytes | memoryview
+    ) -> tuple[HargassnerFrame | None, Exception | None, float]:
+        """Parse one frame and measure the time spent.
 
-    async def _process_data(self, data: bytes) -> None:
-        """Process received telnet data.
+        Runs on the event loop or on the parser worker thread; statistics are
+        only updated by the caller on the event loop.
 
         Args:
-            data: Raw bytes received from telnet
-        """
-        self._stats["messages_received"] += 1
+            line: Complete pm line without line end
 
+        Returns:
+            Tuple of parsed frame, parse error and elapsed seconds
+        """
+        start = time.perf_counter()
         try:
-            # Try multiple encodings
-            text = None
-            for encoding in ["utf-8", "latin-1", "cp1252"]:
-                try:
-                    text = data.decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
+            return self._parser.parse_bytes(line), None, time.perf_counter() - start
+        except Exception as err:
+            return None, err, time.perf_counter() - start
 
-            if text is None:
-                # Fallback: replace invalid characters
-                text = data.decode("utf-8", errors="replace")
-                _LOGGER.debug("Used fallback decoding with character replacement")
+    def _parse_line(self, line: bytes | memoryview) -> HargassnerFrame | None:
+        """Parse one complete pm frame on the event loop.
 
-            # Split into lines and process each
-            lines = text.strip().split("\n")
+        Args:
+            line: Complete pm line without line end
 
-            for line in lines:
-                line = line.strip()
-                if not line or not line.startswith("pm"):
-                    continue
+        Returns:
+            Parsed frame, or None if the line could not be parsed
+        """
+        return self._record_parse(*self._parse_timed(line))
 
-                # Parse message
-                try:
-                    parsed_data = self._parser.parse_message(line)
+    async def _async_parse_offloaded(self, line: bytes) -> HargassnerFrame | None:
+        """Parse one complete pm frame on the parser worker thread.
 
-                    if parsed_data:
-                        # Store data
-                        async with self._data_lock:
-                            self._latest_data = parsed_data
-                            self._last_update = datetime.now()
+        Args:
+            line: Complete pm line without line end
 
-                        self._stats["messages_parsed"] += 1
+        Returns:
+            Parsed frame, or None if the line could not be parsed
+        """
+        loop = asyncio.get_running_loop()
+        frame, error, elapsed = await loop.run_in_executor(
+            self._executor, self._parse_timed, line
+        )
+        self._stats["parse_seconds_offloaded"] += elapsed
+        return self._record_parse(frame, error, elapsed)
+
+    def _record_parse(
+        self,
+        frame: HargassnerFrame | None,
+        error: Exception | None,
+        elapsed: float,
+    ) -> HargassnerFrame | None:
+        """Update parse statistics.
 
-                        # Notify callbacks
-                        for callback in self._data_callbacks:
-                            try:
-                                callback(parsed_data)
-                            except Exception as err:
-                                _LOGGER.error("Error in data callback: %s", err)
+        Args:
+            frame: Parsed frame, or None
+            error: Parse error, or None
+            elapsed: Seconds spent parsing
+
+        Returns:
+            The parsed frame, or None if parsing failed
+        """
+        self._stats["parse_seconds"] += elapsed
+        if error is not None:
+            _LOGGER.warning("Failed to parse message: %s", error)
+            self._stats["parse_errors"] += 1
+            return None
 
-                        # Only process the most recent message
-                        break
+        if frame is not None:
+            self._stats["messages_parsed"] += 1
+        return frame
 
-                except Exception as err:
-                    _LOGGER.warning("Failed to parse message: %s", err)
-                    self._stats["parse_errors"] += 1
+    def _publish(self, frame: HargassnerFrame, received_time: datetime) -> None:
+        """Publish a parsed frame and queue it for callbacks.
 
-        except Exception as err:
-            _LOGGER.error("Error processing data: %s", err, exc_info=True)
-            self._stats["parse_errors"] += 1
+        Frames are immutable once published, so publication is a plain
+        reference swap and readers never need a lock or a copy. Callbacks run
+        from their own queues and never delay the receiver.
 
-    async def get_latest_data(self) -> dict[str, ParameterData]:
+        Args:
+            frame: Newly parsed and stamped frame
+            received_time: Wall clock time the frame was received
+        """
+        frame.published_at = asyncio.get_running_loop().time()
+        self._stats["sequence"] = frame.sequence
+        self._stats["publish_latency"] = frame.latency
+        self._last_update = received_time
+        self._latest_data = frame
+
+        for subscriber in self._subscribers.values():
+            subscriber.offer(frame)
+
+    async def get_latest_data(self) -> HargassnerFrame | None:
         """Get the latest parsed data.
 
         Returns:
-            Dictionary with latest boiler parameters
+            Frame with latest boiler parameters, or None if none received yet
         """
-        async with self._data_lock:
-            return self._latest_data.copy()
+        return self._latest_data
 
-    def register_callback(self, callback: Callable[[dict[str, ParameterData]], None]) -> None:
+    @property
+    def latest_data(self) -> HargassnerFrame | None:
+        """Return the latest published frame without copying."""
+        return self._latest_data
+
+    def register_callback(
+        self,
+        callback: Callable[[HargassnerFrame], Awaitable[None] | None],
+        policy: str = CALLBACK_POLICY_CONFLATE,
+        maxsize: int = CALLBACK_QUEUE_SIZE,
+    ) -> None:
         """Register a callback for new data.
 
         Args:
-            callback: Function to call when new data is available
+            callback: Function or coroutine function to call with new frames
+            policy: CALLBACK_POLICY_CONFLATE (only the newest pending frame is
+                delivered) or CALLBACK_POLICY_DROP_OLDEST
+            maxsize: Queue size for the drop-oldest policy
         """
-        if callback not in self._data_callbacks:
-            self._data_callbacks.append(callback)
+        if callback not in self._subscribers:
+            self._subscribers[callback] = CallbackSubscriber(callback, policy, maxsize)
 
-    def unregister_callback(self, callback: Callable[[dict[str, ParameterData]], None]) -> None:
+    def unregister_callback(
+        self, callback: Callable[[HargassnerFrame], Awaitable[None] | None]
+    ) -> None:
         """Unregister a data callback.
 
         Args:
             callback: Function to remove from callbacks
         """
-        if callback in self._data_callbacks:
-            self._data_callbacks.remove(callback)
+        subscriber = self._subscribers.pop(callback, None)
+        if subscriber is not None:
+            subscriber.cancel()
+
+    def set_subscriptions(self, names: Iterable[str] | None) -> None:
+        """Restrict parsing to the channels consumers actually use.
+
+        Args:
+            names: Parameter names to convert, or None for all channels
+        """
+        if self._executor is not None:
+            # Apply between two parses on the worker thread
+            self._executor.submit(
+                self._parser.set_subscriptions,
+                None if names is None else tuple(names),
+            )
+            return
+        self._parser.set_subscriptions(names)
 
     @property
     def connected(self) -> bool:
@@ -294,6 +700,28 @@ class HargassnerTelnetClient:
         """Return client statistics."""
         return self._stats.copy()
 
+    @property
+    def callback_statistics(self) -> dict[str, dict[str, Any]]:
+        """Return lag, drop and duration statistics per callback."""
+        return {
+            subscriber.name: subscriber.statistics
+            for subscriber in self._subscribers.values()
+        }
+
+    @property
+    def connection_info(self) -> ConnectionInfo:
+        """Return connection metadata with a read-only statistics snapshot."""
+        return ConnectionInfo(
+            connected=self._connected,
+            last_update=self._last_update,
+            statistics=MappingProxyType(dict(self._stats)),
+        )
+
+    @property
+    def firmware_version(self) -> str:
+        """Return the firmware version in use (may differ if autodetected)."""
+        return self._parser.firmware_version
+
     @property
     def expected_message_length(self) -> int:
         """Return expected message length for current firmware."""
@@ -0,0 +1,508 @@
+"""Transports delivering pm frames from the boiler."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+from abc import ABC, abstractmethod
+from asyncio import StreamReader, StreamWriter
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
+from pathlib import Path
+
+from .capture import read_frames
+from .const import (
+    REPLAY_BATCH_FRAMES,
+    REPLAY_SPEED_MAX,
+    TELNET_BUFFER_SIZE,
+    TELNET_KEEPALIVE_COUNT,
+    TELNET_KEEPALIVE_IDLE,
+    TELNET_KEEPALIVE_INTERVAL,
+    TELNET_FRAME_PERIOD,
+    TELNET_TIMEOUT,
+)
+from .exceptions import HargassnerConnectionError, HargassnerEndOfDataError
+from .framing import LineFramer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Free space below which the receive buffer is compacted
+_COMPACT_THRESHOLD = 4096
+
+
+def enable_keepalive(sock: socket.socket | None) -> None:
+    """Enable TCP keepalive so a half-open connection is detected.
+
+    Args:
+        sock: Connected socket, or None if the transport has none
+    """
+    if sock is None:
+        return
+
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError as err:
+        _LOGGER.debug("Failed to enable TCP keepalive: %s", err)
+        return
+
+    # Timing options are platform specific
+    for option, value in (
+        ("TCP_KEEPIDLE", TELNET_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TELNET_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", TELNET_KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, option):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            except OSError as err:
+                _LOGGER.debug("Failed to set %s: %s", option, err)
+
+
+class HargassnerTransport(ABC):
+    """Connection to a source of pm frames.
+
+    A transport object lives as long as the client and is opened again on
+    every reconnect, so its counters cover all connections. If ``line_sink``
+    is set it is called with every received pm line, oldest first, including
+    lines that are coalesced away; the argument is only valid during the call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the transport counters."""
+        self.frames = 0
+        self.coalesced = 0
+        self.line_sink: Callable[[bytes | memoryview], None] | None = None
+
+    @abstractmethod
+    async def async_open(self) -> None:
+        """Open the connection.
+
+        Raises:
+            asyncio.TimeoutError: If the connection is not established in time
+            OSError: If the connection fails
+        """
+
+    @abstractmethod
+    async def async_read_frame(self, timeout: float) -> bytes | memoryview | None:
+        """Wait for the newest complete pm frame.
+
+        A returned memoryview is only valid until the next await.
+
+        Args:
+            timeout: Seconds to wait for a frame
+
+        Returns:
+            Newest complete pm line, or None on timeout
+
+        Raises:
+            HargassnerConnectionError: If the connection was closed
+        """
+
+    @abstractmethod
+    async def async_close(self) -> None:
+        """Close the connection."""
+
+
+class StreamTransport(HargassnerTransport):
+    """Transport reading through asyncio streams."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        buffer_size: int = TELNET_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            host: IP address or hostname of the boiler
+            port: Telnet port
+            buffer_size: Maximum bytes per read
+        """
+        super().__init__()
+        self._host = host
+        self._port = port
+        self._buffer_size = buffer_size
+        self._framer = LineFramer(buffer_size)
+        self._reader: StreamReader | None = None
+        self._writer: StreamWriter | None = None
+
+    async def async_open(self) -> None:
+        """Open the connection."""
+        self._framer.reset()
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port),
+            timeout=TELNET_TIMEOUT,
+        )
+        enable_keepalive(self._writer.get_extra_info("socket"))
+
+    async def async_read_frame(self, timeout: float) -> bytes | None:
+        """Wait for the newest complete pm frame.
+
+        Args:
+            timeout: Seconds to wait per read
+
+        Returns:
+            Newest complete pm line, or None on timeout
+        """
+        if self._reader is None:
+            raise HargassnerConnectionError("Not connected")
+
+        while True:
+            try:
+                data = await asyncio.wait_for(
+                    self._reader.read(self._buffer_size),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                return None
+
+            if not data:
+                raise HargassnerConnectionError("Connection closed by server")
+
+            line = self._framer.feed(data, self.line_sink)
+            self.frames = self._framer.frames
+            self.coalesced = self._framer.coalesced
+            if line is not None:
+                return line
+
+    async def async_close(self) -> None:
+        """Close the connection."""
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+            except Exception as err:
+                _LOGGER.debug("Error closing connection: %s", err)
+            finally:
+                self._writer = None
+                self._reader = None
+
+
+class BufferedProtocolTransport(HargassnerTransport, asyncio.BufferedProtocol):
+    """Transport receiving into a preallocated buffer.
+
+    The event loop writes received bytes straight into a reusable bytearray;
+    frames are located in place and handed out as memoryviews, so no bytes
+    object is created per read. The read timeout is a single deadline timer
+    that is only re-armed once per timeout period instead of once per read.
+
+    Buffer layout: [0:_tail] holds the pending frame (if any) and
+    complete lines, [_tail:_used] the partial line still being received.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        buffer_size: int = TELNET_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            host: IP address or hostname of the boiler
+            port: Telnet port
+            buffer_size: Size of the receive buffer
+        """
+        super().__init__()
+        self._host = host
+        self._port = port
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._tail = 0
+        self._used = 0
+        self._frame: tuple[int, int] | None = None
+        self._transport: asyncio.Transport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._waiter: asyncio.Future[None] | None = None
+        self._deadline: asyncio.TimerHandle | None = None
+        self._timeout = TELNET_TIMEOUT
+        self._last_frame = 0.0
+        self._wait_since = 0.0
+
+    async def async_open(self) -> None:
+        """Open the connection."""
+        self._loop = asyncio.get_running_loop()
+        self._tail = self._used = 0
+        self._frame = None
+        await asyncio.wait_for(
+            self._loop.create_connection(lambda: self, self._host, self._port),
+            timeout=TELNET_TIMEOUT,
+        )
+        self._last_frame = self._loop.time()
+
+    async def async_read_frame(self, timeout: float) -> memoryview | None:
+        """Wait for the newest complete pm frame.
+
+        Args:
+            timeout: Seconds without a frame before returning None
+
+        Returns:
+            Newest complete pm line as a view into the receive buffer,
+            or None on timeout
+        """
+        if self._frame is None:
+            if self._transport is None or self._loop is None:
+                raise HargassnerConnectionError("Connection closed by server")
+
+            self._timeout = timeout
+            self._wait_since = self._loop.time()
+            self._waiter = self._loop.create_future()
+            if self._deadline is None:
+                self._arm_deadline()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+            if self._frame is None:
+                if self._transport is None:
+                    raise HargassnerConnectionError("Connection closed by server")
+                return None
+
+        start, end = self._frame
+        self._frame = None
+        return self._view[start:end]
+
+    async def async_close(self) -> None:
+        """Close the connection."""
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        self._wake()
+
+    def _arm_deadline(self) -> None:
+        """Schedule the timeout check for the current wait."""
+        assert self._loop is not None
+        when = max(self._last_frame, self._wait_since) + self._timeout
+        self._deadline = self._loop.call_at(when, self._on_deadline)
+
+    def _on_deadline(self) -> None:
+        """Time out the current wait unless a frame arrived meanwhile."""
+        self._deadline = None
+        if self._waiter is None or self._loop is None:
+            return
+        if self._loop.time() < max(self._last_frame, self._wait_since) + self._timeout:
+            self._arm_deadline()
+            return
+        self._wake()
+
+    def _wake(self) -> None:
+        """Resume a pending read."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport of a new connection."""
+        self._transport = transport  # type: ignore[assignment]
+        enable_keepalive(transport.get_extra_info("socket"))
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Resume a pending read when the connection is gone."""
+        if exc is not None:
+            _LOGGER.debug("Connection lost: %s", exc)
+        self._transport = None
+        self._wake()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the free part of the receive buffer."""
+        size = len(self._buffer)
+        if size - self._used < _COMPACT_THRESHOLD:
+            keep = self._frame[0] if self._frame is not None else self._tail
+            if keep:
+                # Move the pending frame and partial line to the front
+                self._buffer[: self._used - keep] = self._buffer[keep : self._used]
+                if self._frame is not None:
+                    self._frame = (0, self._frame[1] - keep)
+                self._tail -= keep
+                self._used -= keep
+
+            if self._used == size:
+                _LOGGER.debug("Dropping %d bytes without line end", self._used - self._tail)
+                self._used = self._tail
+                if self._used == size:
+                    self._frame = None
+                    self._tail = self._used = 0
+
+        return self._view[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Locate the newest complete frame in the received bytes."""
+        buffer = self._buffer
+        received = self._used
+        self._used += nbytes
+
+        end = buffer.rfind(b"\n", received, self._used)
+        if end < 0:
+            return
+
+        region = self._tail
+        self._tail = end + 1
+        frames = buffer.count(b"\npm", region, end) + buffer.startswith(b"pm", region, end)
+        if not frames:
+            return
+
+        # Walk back line by line to the newest pm line
+        line_end = end
+        while True:
+            newline = buffer.rfind(b"\n", region, line_end)
+            line_start = newline + 1 if newline >= 0 else region
+            if buffer.startswith(b"pm", line_start, line_end):
+                break
+            line_end = newline
+        while line_end > line_start and buffer[line_end - 1] in b" \t\r":
+            line_end -= 1
+
+        if self.line_sink is not None:
+            self._emit_lines(region, end)
+
+        self.frames += frames
+        self.coalesced += frames - 1 + (self._frame is not None)
+        self._frame = (line_start, line_end)
+        if self._loop is not None:
+            self._last_frame = self._loop.time()
+        self._wake()
+
+    def _emit_lines(self, start: int, end: int) -> None:
+        """Pass every pm line of a received region to the line sink.
+
+        Args:
+            start: Offset of the first complete line
+            end: Offset of the newline ending the last complete line
+        """
+        buffer = self._buffer
+        sink = self.line_sink
+        assert sink is not None
+        while start < end:
+            newline = buffer.find(b"\n", start, end)
+            line_end = newline if newline >= 0 else end
+            if buffer.startswith(b"pm", start, line_end):
+                stripped = line_end
+                while stripped > start and buffer[stripped - 1] in b" \t\r":
+                    stripped -= 1
+                sink(self._view[start:stripped])
+            start = line_end + 1
+
+    def eof_received(self) -> bool:
+        """Let the transport close when the boiler ends the stream."""
+        return False
+
+
+class ReplayTransport(HargassnerTransport):
+    """Transport replaying recorded frames instead of reading a socket.
+
+    Sources are capture files (see capture.py) or DAQ/text logs with one pm
+    line per row. Frames are paced by their recorded time divided by
+    ``speed`` (frames without a time follow TELNET_FRAME_PERIOD apart);
+    REPLAY_SPEED_MAX delivers them as fast as the consumer reads. Every
+    frame is delivered, nothing is coalesced, so runs are deterministic.
+
+    Files are read in batches by executor jobs. Reopening after a stale
+    reconnect resumes where the replay stopped; the end of the data raises
+    HargassnerEndOfDataError.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str | Path],
+        speed: float = 1.0,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            paths: Recordings to replay in order
+            speed: Replay speed factor (1.0 = real time, REPLAY_SPEED_MAX
+                = as fast as possible)
+
+        Raises:
+            ValueError: If speed is negative
+        """
+        if not speed >= 0:  # also rejects NaN
+            raise ValueError(f"Invalid replay speed: {speed}")
+        super().__init__()
+        self._paths = [Path(path) for path in paths]
+        self._speed = speed
+        self._source: Iterator[tuple[float | None, bytes]] | None = None
+        self._batch: deque[tuple[float | None, bytes]] = deque()
+        self._exhausted = False
+        self._open = False
+
+        # Pacing: recorded time of the anchor frame and its loop time
+        self._recorded = 0.0
+        self._origin: float | None = None
+        self._start = 0.0
+
+    async def async_open(self) -> None:
+        """Open the replay, resuming after the last delivered frame."""
+        if self._source is None:
+            self._source = chain.from_iterable(read_frames(path) for path in self._paths)
+        self._origin = None
+        self._open = True
+
+    async def async_read_frame(self, timeout: float) -> bytes | None:
+        """Wait until the next recorded frame is due.
+
+        Args:
+            timeout: Seconds to wait for a frame
+
+        Returns:
+            Next recorded pm line, or None on timeout
+
+        Raises:
+            HargassnerEndOfDataError: If all recordings have been replayed
+        """
+        if not self._open:
+            raise HargassnerConnectionError("Replay closed")
+
+        if not self._batch and not self._exhausted:
+            await self._async_read_batch()
+        if not self._batch:
+            raise HargassnerEndOfDataError("End of replay")
+
+        recorded, line = self._batch[0]
+        if recorded is None:
+            recorded = self._recorded + TELNET_FRAME_PERIOD
+
+        if self._speed == REPLAY_SPEED_MAX:
+            # Still yield so publishing and callbacks keep up
+            await asyncio.sleep(0)
+        else:
+            now = asyncio.get_running_loop().time()
+            if self._origin is None or recorded < self._recorded:
+                # First frame, or the recorded clock went backwards
+                self._origin = recorded
+                self._start = now
+            delay = self._start + (recorded - self._origin) / self._speed - now
+            if delay > timeout:
+                await asyncio.sleep(timeout)
+                return None
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        if not self._open:
+            raise HargassnerConnectionError("Replay closed")
+
+        self._batch.popleft()
+        self._recorded = recorded
+        self.frames += 1
+        if self.line_sink is not None:
+            self.line_sink(line)
+        return line
+
+    async def _async_read_batch(self) -> None:
+        """Read the next frames from the recordings in an executor job."""
+        assert self._source is not None
+        batch = await asyncio.get_running_loop().run_in_executor(
+            None, list, islice(self._source, REPLAY_BATCH_FRAMES)
+        )
+        if len(batch) < REPLAY_BATCH_FRAMES:
+            self._exhausted = True
+        self._batch.extend(batch)
+
+    async def async_close(self) -> None:
+        """Close the replay; the position is kept for reopening."""
+        self._open = False
@@ -1,7 +1,9 @@
 """Type definitions for Hargassner Integration."""
 from __future__ import annotations
 
-from typing import TypedDict
+from collections.abc import Mapping
+from datetime import datetime
+from typing import NamedTuple, TypedDict
 
 
 class ParameterData(TypedDict):
@@ -18,10 +20,31 @@ class StatisticsData(TypedDict):
     messages_received: int
     messages_parsed: int
     parse_errors: int
+    frames_coalesced: int
     reconnections: int
+    stale_reconnects: int
+    parse_seconds: float
+    parse_seconds_offloaded: float
+    sequence: int
+    frame_interval: float | None
+    frame_period: float
+    frames_late: int
+    frames_missed: int
+    publish_latency: float | None
+    standby_state: str
+    failovers: int
+    failover_latency: float | None
     last_error: str | None
 
 
+class ConnectionInfo(NamedTuple):
+    """Connection metadata, kept apart from the data snapshot."""
+
+    connected: bool
+    last_update: datetime | None
+    statistics: Mapping[str, int | float | str | None]
+
+
 class BilingualText(TypedDict):
     """Bilingual text structure."""
 
@@ -0,0 +1,72 @@
+"""Publish rate of entity updates depending on the boiler state."""
+from __future__ import annotations
+
+import math
+
+from .const import (
+    BOILER_STATES_EN,
+    STATE_UPDATE_INTERVALS,
+    UPDATE_HEARTBEAT,
+    WILDCARD,
+)
+
+# Lower-case English state names by ZK value
+_STATE_INDEX = {name.lower(): index for index, name in enumerate(BOILER_STATES_EN)}
+
+
+def parse_state_intervals(text: str) -> dict[str, float]:
+    """Parse a per-state update interval configuration.
+
+    The configuration is a comma-separated list of ``STATE=SECONDS``
+    entries with the English boiler state names of BOILER_STATES_EN (case
+    insensitive); ``*`` sets the interval of all states without an own
+    entry and replaces the STATE_UPDATE_INTERVALS defaults.
+
+    Args:
+        text: Configuration, e.g. ``"Off=60, Full firing=2"``
+
+    Returns:
+        Intervals by state name as listed in BOILER_STATES_EN (or ``*``)
+
+    Raises:
+        ValueError: If an entry is malformed, names an unknown state or
+            is outside 0 to UPDATE_HEARTBEAT seconds
+    """
+    intervals: dict[str, float] = {}
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, separator, value = entry.partition("=")
+        name = name.strip()
+        if not separator or not name:
+            raise ValueError(f"Invalid state interval entry: {entry}")
+        if name != WILDCARD:
+            if name.lower() not in _STATE_INDEX:
+                raise ValueError(f"Unknown boiler state: {name}")
+            name = BOILER_STATES_EN[_STATE_INDEX[name.lower()]]
+        seconds = float(value)
+        if not math.isfinite(seconds) or not 0 <= seconds <= UPDATE_HEARTBEAT:
+            raise ValueError(f"Invalid state interval: {entry}")
+        intervals[name] = seconds
+    return intervals
+
+
+def resolve_state_intervals(overrides: dict[str, float]) -> dict[int, float]:
+    """Map the configured intervals to ZK values.
+
+    Args:
+        overrides: Configured intervals (see parse_state_intervals)
+
+    Returns:
+        Update interval by ZK value; states without an entry use the
+        minimum update interval
+    """
+    if WILDCARD in overrides:
+        intervals = {name: overrides[WILDCARD] for name in BOILER_STATES_EN}
+    else:
+        intervals = dict(STATE_UPDATE_INTERVALS)
+    intervals.update(
+        (name, seconds) for name, seconds in overrides.items() if name != WILDCARD
+    )
+    return {_STATE_INDEX[name.lower()]: seconds for name, seconds in intervals.items()}
@@ -0,0 +1,81 @@
+"""Tests for the raw frame capture."""
+import gzip
+
+import pytest
+
+
+@pytest.fixture
+def capture_module():
+    """Return the capture module (requires Home Assistant)."""
+    return pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.capture"
+    )
+
+
+def test_capture_round_trip(capture_module, tmp_path):
+    """Delta-encoded frames are read back unchanged, across batches."""
+    capture = capture_module.FrameCapture(tmp_path)
+    batch = [
+        (1700000000.0, b"pm 1 2.5 3 x"),
+        (1700000001.25, b"pm 1  2.6 3 y\r"),
+        (1700000002.5, b"pm 1 2.6 3 y"),
+    ]
+    capture.write_batch(batch[:2])
+    capture.write_batch(batch[2:])
+
+    files = capture_module.capture_files(tmp_path)
+    assert len(files) == 1
+    records = gzip.decompress(files[0].read_bytes()).splitlines()
+    assert records[1] == b"1250\tD\t3=2.6 2=y"
+
+    frames = list(capture_module.read_capture(files[0]))
+    assert frames == [
+        (1700000000.0, b"pm 1 2.5 3 x"),
+        (1700000001.25, b"pm 1 2.6 3 y"),
+        (1700000002.5, b"pm 1 2.6 3 y"),
+    ]
+    assert capture.frames_written == 3
+
+
+def test_capture_rotation_and_retention(capture_module, tmp_path):
+    """Files rotate at the size limit and the oldest are removed."""
+    capture = capture_module.FrameCapture(tmp_path, file_bytes=1, max_bytes=150)
+    for second in range(10):
+        capture.write_batch([(1700000000.0 + second, b"pm %d 0 0 0" % second)])
+
+    files = capture_module.capture_files(tmp_path)
+    assert 1 < len(files) < 10
+    assert list(capture_module.read_capture(files[-1])) == [
+        (1700000009.0, b"pm 9 0 0 0")
+    ]
+
+
+def test_capture_recovers_from_failed_write(capture_module, tmp_path, monkeypatch):
+    """After a failed write the next batch starts a new file with a full frame."""
+    capture = capture_module.FrameCapture(tmp_path)
+    capture.write_batch([(1700000000.0, b"pm 1 2 3"), (1700000001.0, b"pm 1 2 4")])
+
+    gzip_open = gzip.open
+
+    def failing_open(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(capture_module.gzip, "open", failing_open)
+    with pytest.raises(OSError):
+        capture.write_batch([(1700000002.0, b"pm 1 5 5")])
+    monkeypatch.setattr(capture_module.gzip, "open", gzip_open)
+
+    capture.write_batch([(1700000003.0, b"pm 1 5 6"), (1700000004.0, b"pm 1 5 7")])
+
+    frames = [
+        frame
+        for path in capture_module.capture_files(tmp_path)
+        for frame in capture_module.read_capture(path)
+    ]
+    assert frames == [
+        (1700000000.0, b"pm 1 2 3"),
+        (1700000001.0, b"pm 1 2 4"),
+        (1700000003.0, b"pm 1 5 6"),
+        (1700000004.0, b"pm 1 5 7"),
+    ]
+    assert capture.frames_written == 4
@@ -0,0 +1,248 @@
+"""Tests for the data update coordinator."""
+import asyncio
+import types
+from datetime import datetime
+
+import pytest
+
+FIRMWARE = "V14_1HAR_q1"
+PACKAGE = "custom_components.bauergroup_hargassnerintegration"
+
+
+@pytest.fixture
+def coordinator_module():
+    """Return the coordinator module (requires Home Assistant)."""
+    return pytest.importorskip(f"{PACKAGE}.coordinator")
+
+
+class _Frames:
+    """Build parsed frames with chosen channel values (all others 0)."""
+
+    def __init__(self) -> None:
+        message_parser = pytest.importorskip(f"{PACKAGE}.message_parser")
+        self.parser = message_parser.HargassnerMessageParser(FIRMWARE, auto_detect=False)
+        self.schema = self.parser.schema
+
+    def __call__(self, **values: str):
+        tokens = ["0"] * self.schema.expected_length
+        for name, value in values.items():
+            tokens[self.schema.by_name[name].index] = value
+        return self.parser.parse_message("pm " + " ".join(tokens))
+
+
+async def _setup(coordinator_module, **data):
+    """Return a Home Assistant instance and a coordinator on an idle client."""
+    homeassistant = pytest.importorskip("homeassistant.core")
+    telnet_client = pytest.importorskip(f"{PACKAGE}.telnet_client")
+    hass = homeassistant.HomeAssistant("/tmp")
+    client = telnet_client.HargassnerTelnetClient("127.0.0.1", FIRMWARE)
+    entry = types.SimpleNamespace(data=data, entry_id="test")
+    return hass, coordinator_module.HargassnerDataUpdateCoordinator(hass, client, entry)
+
+
+async def _teardown(hass, coordinator) -> None:
+    """Shut the coordinator and Home Assistant down."""
+    await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
+
+
+def test_push_throttled_to_min_interval(coordinator_module):
+    """A burst publishes its first frame at once and its last one later."""
+    const = pytest.importorskip(f"{PACKAGE}.const")
+    frames = _Frames()
+
+    async def run():
+        hass, coordinator = await _setup(
+            coordinator_module, **{const.CONF_MIN_UPDATE_INTERVAL: 0.2}
+        )
+        published = []
+        coordinator.async_add_listener(lambda: published.append(coordinator.data))
+        burst = [frames(TK=f"{index}.5") for index in range(4)]
+
+        for frame in burst:
+            coordinator._async_handle_frame(frame)
+        assert published == [burst[0]]
+
+        await asyncio.sleep(0.3)
+        assert published == [burst[0], burst[-1]]
+
+        await asyncio.sleep(0.3)
+        assert len(published) == 2
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
+
+
+def test_zero_interval_publishes_every_frame(coordinator_module):
+    """A minimum update interval of 0 publishes every pushed frame."""
+    const = pytest.importorskip(f"{PACKAGE}.const")
+    frames = _Frames()
+
+    async def run():
+        hass, coordinator = await _setup(
+            coordinator_module, **{const.CONF_MIN_UPDATE_INTERVAL: 0}
+        )
+        published = []
+        coordinator.async_add_listener(lambda: published.append(coordinator.data))
+        burst = [frames(TK=f"{index}.5") for index in range(4)]
+
+        for frame in burst:
+            coordinator._async_handle_frame(frame)
+        assert published == burst
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
+
+
+def test_heartbeat_fails_on_stale_or_missing_data(coordinator_module):
+    """The heartbeat fails without data or connection and on silence."""
+    const = pytest.importorskip(f"{PACKAGE}.const")
+    update_failed = pytest.importorskip(
+        "homeassistant.helpers.update_coordinator"
+    ).UpdateFailed
+    frames = _Frames()
+
+    async def run():
+        hass, coordinator = await _setup(coordinator_module)
+        client = coordinator.telnet_client
+        with pytest.raises(update_failed):
+            await coordinator._async_update_data()
+
+        client._connected = True
+        assert await coordinator._async_update_data() == {}
+
+        frame = frames(TK="1.5")
+        client._latest_data = frame
+        now = hass.loop.time()
+        frame.stamp(1, now - 1, datetime.now())
+        assert await coordinator._async_update_data() is frame
+
+        # Home Assistant may run the heartbeat up to a second early
+        frame.stamp(1, now - const.UPDATE_HEARTBEAT + 0.5, datetime.now())
+        with pytest.raises(update_failed):
+            await coordinator._async_update_data()
+
+        frame.stamp(1, now - 2 * const.UPDATE_HEARTBEAT, datetime.now())
+        with pytest.raises(update_failed):
+            await coordinator._async_update_data()
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
+
+
+def test_listeners_called_for_changed_channels_only(coordinator_module):
+    """Channel listeners follow their channels; plain listeners every update."""
+    const = pytest.importorskip(f"{PACKAGE}.const")
+    frames = _Frames()
+
+    async def run():
+        hass, coordinator = await _setup(
+            coordinator_module,
+            **{const.CONF_MIN_UPDATE_INTERVAL: 0, const.CONF_DEADBANDS: "*=0"},
+        )
+        calls = []
+        remove_tk = coordinator.async_add_listener(lambda: calls.append("TK"), ("TK",))
+        coordinator.async_add_listener(lambda: calls.append("TRL"), ("TRL", "TK"))
+        coordinator.async_add_listener(lambda: calls.append("plain"))
+
+        coordinator._async_handle_frame(frames(TK="1.5"))
+        assert sorted(calls) == ["TK", "TRL", "plain"]
+
+        calls.clear()
+        coordinator._async_handle_frame(frames(TK="1.5", TRL="2.5"))
+        assert sorted(calls) == ["TRL", "plain"]
+
+        calls.clear()
+        coordinator._async_handle_frame(frames(TK="3.5", TRL="2.5"))
+        assert sorted(calls) == ["TK", "TRL", "plain"]
+
+        remove_tk()
+        assert "TK" in coordinator._channel_listeners
+        calls.clear()
+        coordinator._async_handle_frame(frames(TK="4.5", TRL="2.5"))
+        assert sorted(calls) == ["TRL", "plain"]
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
+
+
+def test_removed_listener_leaves_index(coordinator_module):
+    """Removing the last listener of a channel drops it from the index."""
+    const = pytest.importorskip(f"{PACKAGE}.const")
+    frames = _Frames()
+
+    async def run():
+        hass, coordinator = await _setup(
+            coordinator_module,
+            **{const.CONF_MIN_UPDATE_INTERVAL: 0, const.CONF_DEADBANDS: "*=0"},
+        )
+        calls = []
+        remove = coordinator.async_add_listener(lambda: calls.append("TK"), ("TK",))
+        coordinator._async_handle_frame(frames(TK="1.5"))
+        remove()
+
+        assert "TK" not in coordinator._channel_listeners
+        coordinator._async_handle_frame(frames(TK="2.5"))
+        assert calls == ["TK"]
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
+
+
+def test_channel_subscriptions_are_reference_counted(coordinator_module):
+    """The parser keeps converting a channel while anyone subscribes it."""
+
+    async def run():
+        hass, coordinator = await _setup(coordinator_module)
+        parser = coordinator.telnet_client._parser
+        unsubscribe_first = coordinator.async_subscribe_channels(("TK", "TRL"))
+        unsubscribe_second = coordinator.async_subscribe_channels(("TK",))
+        await asyncio.sleep(0)
+        assert parser.subscriptions == {"ZK", "TK", "TRL"}
+
+        unsubscribe_first()
+        assert set(coordinator._channel_refs) == {"ZK", "TK"}
+        await asyncio.sleep(0)
+        assert parser.subscriptions == {"ZK", "TK"}
+
+        unsubscribe_second()
+        await asyncio.sleep(0)
+        assert parser.subscriptions == {"ZK"}
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
+
+
+def test_cadence_holds_slow_channels_until_next_push(coordinator_module):
+    """A held setpoint change is published with the first push after its cadence."""
+    const = pytest.importorskip(f"{PACKAGE}.const")
+    frames = _Frames()
+
+    async def run():
+        hass, coordinator = await _setup(
+            coordinator_module,
+            **{
+                const.CONF_MIN_UPDATE_INTERVAL: 0,
+                const.CONF_DEADBANDS: "*=0",
+                const.CONF_CADENCE_SETPOINT: 0.3,
+            },
+        )
+        calls = []
+        coordinator.async_add_listener(lambda: calls.append("TK"), ("TK",))
+        coordinator.async_add_listener(lambda: calls.append("TKsoll"), ("TKsoll",))
+
+        coordinator._async_handle_frame(frames(TK="1.5", TKsoll="70"))
+        calls.clear()
+        coordinator._async_handle_frame(frames(TK="2.5", TKsoll="71"))
+        assert calls == ["TK"]
+
+        # The cadence expiring alone does not publish the held change
+        await asyncio.sleep(0.4)
+        assert calls == ["TK"]
+
+        coordinator._async_handle_frame(frames(TK="3.5", TKsoll="71"))
+        assert sorted(calls) == ["TK", "TK", "TKsoll"]
+        assert coordinator._published["TKsoll"][0] == 71
+        await _teardown(hass, coordinator)
+
+    asyncio.run(run())
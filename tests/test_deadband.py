@@ -0,0 +1,52 @@
+"""Tests for deadband significance filtering."""
+import pytest
+
+
+@pytest.fixture
+def deadband():
+    """Return the deadband module (requires Home Assistant)."""
+    return pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.deadband"
+    )
+
+
+def test_defaults_follow_unit_and_dop(deadband):
+    """Temperatures filter jitter, integer and digital channels do not."""
+    schema = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    ).get_firmware_schema("V14_1HAR_q1")
+
+    assert deadband.default_deadband(schema.by_name["TK"]) == (0.5, False)
+    assert deadband.default_deadband(schema.by_name["O2"]) == (1.0, False)
+    assert deadband.default_deadband(schema.by_name["ZK"]) == (0.0, False)
+    digital = next(param for param in schema.parameters if param.is_digital)
+    assert deadband.default_deadband(digital) == (0.0, False)
+
+
+def test_exceeded(deadband):
+    """Absolute and relative deadbands, non-numeric values always count."""
+    absolute = deadband.Deadband(0.5)
+    assert not absolute.exceeded(67.4, 67.5)
+    assert absolute.exceeded(67.9, 67.4)
+    relative = deadband.Deadband(0.1, relative=True)
+    assert not relative.exceeded(10.0, 10.9)
+    assert relative.exceeded(10.0, 11.0)
+    assert absolute.exceeded(True, False)
+    assert absolute.exceeded(None, 1.0)
+    assert not deadband.Deadband(0.0).exceeded(3, 3)
+
+
+def test_parse_and_resolve(deadband):
+    """Configured entries override the wildcard, which overrides defaults."""
+    overrides = deadband.parse_deadbands(" TK=1, O2=5%,, *=0 ")
+    assert overrides == {
+        "TK": (1.0, False),
+        "O2": (0.05, True),
+        "*": (0.0, False),
+    }
+    assert deadband.resolve_deadband("TRG", None, overrides) == (0.0, False)
+    assert deadband.resolve_deadband("TRG", None, {}) == (0.0, False)
+
+    for text in ("TK", "=1", "TK=-1", "TK=x", "TK=nan"):
+        with pytest.raises(ValueError):
+            deadband.parse_deadbands(text)
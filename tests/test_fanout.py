@@ -0,0 +1,72 @@
+"""Tests for the callback fan-out."""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def fanout():
+    """Return the fan-out module (requires Home Assistant)."""
+    return pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.fanout"
+    )
+
+
+def test_drop_oldest_keeps_newest_items(fanout):
+    """A full queue drops its oldest item and counts the drop."""
+    received = []
+
+    async def run():
+        subscriber = fanout.CallbackSubscriber(received.append, "drop_oldest", 3)
+        for item in range(5):
+            subscriber.offer(item)
+        await asyncio.sleep(0.01)
+        subscriber.cancel()
+        return subscriber
+
+    subscriber = asyncio.run(run())
+    assert received == [2, 3, 4]
+    assert subscriber.dropped == 2
+    assert subscriber.max_lag == 3
+
+
+def test_conflate_delivers_latest_and_never_blocks_publisher(fanout):
+    """A slow coroutine callback only sees the newest pending item."""
+    received = []
+
+    async def slow(item):
+        received.append(item)
+        await asyncio.sleep(0.05)
+
+    async def run():
+        subscriber = fanout.CallbackSubscriber(slow, "conflate", 8)
+        for item in range(10):
+            subscriber.offer(item)
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        subscriber.cancel()
+        return subscriber
+
+    subscriber = asyncio.run(run())
+    assert received[0] == 0
+    assert received[-1] == 9
+    assert subscriber.dropped == 10 - len(received)
+    assert sum(subscriber.statistics["durations"].values()) == len(received)
+
+
+def test_callback_errors_are_counted(fanout):
+    """A failing callback is isolated and counted."""
+
+    def fail(item):
+        raise RuntimeError("boom")
+
+    async def run():
+        subscriber = fanout.CallbackSubscriber(fail, "conflate", 1)
+        subscriber.offer(1)
+        await asyncio.sleep(0.01)
+        subscriber.cancel()
+        return subscriber
+
+    subscriber = asyncio.run(run())
+    assert subscriber.errors == 1
+    assert subscriber.delivered == 1
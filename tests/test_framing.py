@@ -0,0 +1,33 @@
+"""Tests for telnet line framing."""
+import pytest
+
+
+@pytest.fixture
+def framer():
+    """Return a fresh line framer (requires Home Assistant)."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.framing"
+    )
+    return module.LineFramer(max_size=64)
+
+
+def test_partial_line_is_reassembled(framer):
+    """A frame split across chunks is emitted once it is complete."""
+    assert framer.feed(b"pm 1 2") is None
+    assert framer.feed(b" 3\r\npm 4") == b"pm 1 2 3"
+    assert framer.feed(b" 5\n") == b"pm 4 5"
+    assert framer.coalesced == 0
+
+
+def test_newest_frame_wins(framer):
+    """After a stall only the newest complete frame is returned."""
+    assert framer.feed(b"pm 1\nhello\npm 2\npm 3\npm 4") == b"pm 3"
+    assert framer.coalesced == 2
+    assert framer.frames == 3
+
+
+def test_overflow_drops_unterminated_data(framer):
+    """An unterminated line longer than the buffer limit is discarded."""
+    assert framer.feed(b"x" * 100) is None
+    assert framer.overflows == 1
+    assert framer.feed(b"pm 1\n") == b"pm 1"
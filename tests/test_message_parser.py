@@ -24,3 +24,303 @@ def test_example():
 # - Test encoding handling
 # - Test parameter extraction
 # - Test digital parameter bit extraction
+
+
+
+@pytest.fixture
+def parser():
+    """Return a parser for the default firmware (requires Home Assistant)."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    )
+    return module.HargassnerMessageParser("V14_1HAR_q1")
+
+
+def _build_message(parser, **overrides: str) -> str:
+    """Build a 'pm' line with one token per template channel."""
+    tokens = ["0"] * parser.expected_length
+    for param in parser.parameters:
+        if param.name in overrides:
+            tokens[param.index] = overrides[param.name]
+    return "pm " + " ".join(tokens)
+
+
+def test_parse_converts_by_dop(parser):
+    """Channels with dop='0' parse as int, dop > 0 as float."""
+    result = parser.parse_message(_build_message(parser, ZK="7", TK="67.4", O2="9"))
+
+    assert result is not None
+    assert result["ZK"]["value"] == 7
+    assert isinstance(result["ZK"]["value"], int)
+    assert result["TK"]["value"] == 67.4
+    assert result["TK"]["unit"] == "°C"
+
+    result = parser.parse_message(_build_message(parser, Wasserdruck="2"))
+    assert isinstance(result["Wasserdruck"]["value"], float)
+
+
+def test_parse_keeps_integer_tokens_without_dop(parser):
+    """Channels without dop stay int unless the token has a decimal point."""
+    message = _build_message(parser, O2="9", TK="67.0")
+
+    for frame in (parser.parse_message(message), parser.parse_bytes(message.encode())):
+        assert frame.get_value("O2") == 9
+        assert isinstance(frame.get_value("O2"), int)
+        assert isinstance(frame.get_value("TK"), float)
+
+
+def test_parse_digital_bits(parser):
+    """Digital channels extract their bit from the packed word."""
+    stoerung = parser.get_parameter_info("Störung")
+    stb = parser.get_parameter_info("Stb")
+    tokens = ["0"] * parser.expected_length
+    tokens[stoerung.index] = "2"  # only bit 1 (Stb) set
+    result = parser.parse_message("pm " + " ".join(tokens))
+
+    assert stb.index == stoerung.index
+    assert result["Störung"]["value"] is False
+    assert result["Stb"]["value"] is True
+
+
+def test_parse_short_message(parser):
+    """Channels beyond a truncated message are omitted."""
+    result = parser.parse_message("pm 7 10.1")
+
+    assert result["ZK"]["value"] == 7
+    assert result["O2"]["value"] == 10.1
+    assert "TK" not in result
+
+
+def test_parse_rejects_non_pm_line(parser):
+    """Lines without the 'pm' prefix are ignored."""
+    assert parser.parse_message("zm 1 2 3") is None
+
+
+def test_firmware_schema_is_shared(parser):
+    """Parsers for the same firmware reuse one cached schema."""
+    other = type(parser)("V14_1HAR_q1")
+
+    assert other.schema is parser.schema
+    assert type(parser)("V14_0HAR_q").schema is not parser.schema
+
+
+def test_frame_mapping_view(parser):
+    """Frames expose a lazy read-only mapping over the value array."""
+    frame = parser.parse_message(_build_message(parser, TK="67.4"))
+
+    assert frame.get_value("TK") == 67.4
+    assert frame.get_value("Unknown", "n/a") == "n/a"
+    assert frame.get("Unknown") is None
+    assert frame["TK"] == {
+        "value": 67.4,
+        "unit": "°C",
+        "description": parser.get_parameter_info("TK").description,
+        "timestamp": None,
+    }
+    assert len(frame) == len(parser.parameters)
+    assert list(frame)[0] == "ZK"
+
+
+def test_frame_stamp(parser):
+    """Stamped frames carry sequence, timestamp and publish latency."""
+    from datetime import datetime, timezone
+
+    frame = parser.parse_message(_build_message(parser))
+    frame.stamp(7, 100.0, datetime(2024, 1, 1, tzinfo=timezone.utc))
+    frame.published_at = 100.25
+
+    assert frame.sequence == 7
+    assert frame["ZK"]["timestamp"] == "2024-01-01T00:00:00+00:00"
+    assert frame.latency == 0.25
+
+
+def test_digital_word_flips(parser):
+    """Digital words carry their XOR against the previous frame."""
+    word_index = parser.get_parameter_info("Störung").index - parser.schema.analog_count
+    tokens = ["0"] * parser.expected_length
+    tokens[parser.schema.analog_count + word_index] = "3"
+    parser.parse_message("pm " + " ".join(tokens))
+
+    tokens[parser.schema.analog_count + word_index] = "2"
+    frame = parser.parse_message("pm " + " ".join(tokens))
+
+    assert frame.digital_words[word_index] == 2
+    assert frame.digital_flips[word_index] == 1
+    assert frame.changed_words() == [word_index]
+    assert frame.bit_flipped("Störung")
+    assert not frame.bit_flipped("Stb")
+
+
+def test_change_detection(parser):
+    """Only channels with changed tokens are reported as changed."""
+    first = parser.parse_message(_build_message(parser, TK="67.4", TRG="120.0"))
+    second = parser.parse_message(_build_message(parser, TK="67.5", TRG="120.0"))
+    tk = parser.get_parameter_info("TK")
+
+    assert len(first.changed) == parser.expected_length
+    assert second.changed == frozenset({tk.index})
+    assert second.changed_names() == ["TK"]
+    assert second.get_value("TK") == 67.5
+    assert second.get_value("TRG") == 120.0
+
+
+def test_identical_message_short_circuits(parser):
+    """A repeated message yields the previous state with no changes."""
+    message = _build_message(parser, TK="67.4")
+    first = parser.parse_message(message)
+    second = parser.parse_message(message)
+
+    assert not second.changed
+    assert second.values is first.values
+    assert second.get_value("TK") == 67.4
+
+
+def test_parse_bytes_matches_text(parser):
+    """The bytes entry point yields the same values as parse_message."""
+    message = _build_message(parser, ZK="7", TK="67.4")
+    text_frame = type(parser)("V14_1HAR_q1").parse_message(message)
+    bytes_frame = parser.parse_bytes(memoryview(message.encode("ascii") + b"\r\n"))
+
+    assert dict(bytes_frame) == dict(text_frame)
+    assert parser.parse_bytes(b"\xc3\xa4 diagnostics") is None
+
+
+def test_parse_many(parser):
+    """Batches parse into analog and expanded digital matrices."""
+    np = pytest.importorskip("numpy")
+    lines = [
+        _build_message(parser, TK="67.4", Störung="1"),
+        b"garbage",
+        _build_message(parser, TK="68.0").encode("ascii"),
+        "pm 7 10.1",
+    ]
+    batch = parser.parse_many(lines)
+    tk_column = batch.analog_names.index("TK")
+    stoerung_column = batch.digital_names.index("Störung")
+
+    assert batch.analog.shape == (3, len(batch.analog_names))
+    assert batch.digital.shape == (3, len(batch.digital_names))
+    assert batch.analog[:, tk_column].tolist()[:2] == [67.4, 68.0]
+    assert np.isnan(batch.analog[2, tk_column])
+    assert batch.digital[:, stoerung_column].tolist() == [True, False, False]
+
+
+def test_parse_many_normalizes_row_width(parser):
+    """Rows with a doubled separator or extra tokens are padded or truncated."""
+    np = pytest.importorskip("numpy")
+    width = parser.expected_length
+    good = _build_message(parser, TK="67.4")
+    short = "pm  " + " ".join(["1"] * (width - 1))
+    long = "pm 2\t" + " ".join(["2"] * width)
+    tk_column = parser.parse_many([good]).analog_names.index("TK")
+
+    batch = parser.parse_many([good, short])
+    assert batch.analog.shape == (2, len(batch.analog_names))
+    assert batch.analog[0, tk_column] == 67.4
+    assert batch.analog[1, tk_column] == 1
+    assert np.isnan(batch.analog[1]).sum() <= 1  # only the missing last token
+
+    batch = parser.parse_many([good, long])
+    assert batch.analog.shape == (2, len(batch.analog_names))
+    assert (batch.analog[1] == 2).all()
+
+
+def test_subscriptions_limit_parsing(parser):
+    """Only subscribed channels are converted."""
+    parser.set_subscriptions(["TK", "Störung"])
+    frame = parser.parse_message(_build_message(parser, TK="67.4", TRG="120.0", Störung="1"))
+
+    assert frame.get_value("TK") == 67.4
+    assert frame.get_value("Störung") is True
+    assert "TRG" not in frame
+
+    parser.set_subscriptions(None)
+    frame = parser.parse_message(_build_message(parser, TK="67.4", TRG="120.0", Störung="1"))
+    assert frame.get_value("TRG") == 120.0
+
+
+def test_firmware_autodetection(parser):
+    """Messages from another firmware switch the parser tables."""
+    other = type(parser)("V14_0HAR_q")
+    message = _build_message(other, TK="67.4", Wasserdruck="1.52")
+
+    for _ in range(3):
+        frame = parser.parse_message(message)
+
+    assert parser.firmware_version == "V14_0HAR_q"
+    assert frame.get_value("Wasserdruck") == 1.52
+
+
+def test_failed_detection_not_repeated_for_same_length(parser, monkeypatch):
+    """Detection runs once per unknown frame length, not every few frames."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    )
+    calls = []
+    detect_firmware = module.detect_firmware
+
+    def counting_detect(values):
+        calls.append(len(values))
+        return detect_firmware(values)
+
+    monkeypatch.setattr(module, "detect_firmware", counting_detect)
+    length = max(module._firmware_index()) + 7
+
+    for index in range(10 * module.FIRMWARE_DETECT_FRAMES):
+        parser.parse_message("pm " + " ".join([str(index)] * length))
+    assert calls == [length]
+
+    for index in range(module.FIRMWARE_DETECT_FRAMES):
+        parser.parse_message("pm " + " ".join([str(index)] * (length + 1)))
+    assert calls == [length, length + 1]
+    assert parser.firmware_version == "V14_1HAR_q1"
+
+
+def test_load_firmware_tables_warms_detection():
+    """The executor preload also builds the firmware detection index."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    )
+    module._firmware_index.cache_clear()
+
+    schema = module.load_firmware_tables("V14_1HAR_q1")
+
+    assert schema is module.get_firmware_schema("V14_1HAR_q1")
+    assert module._firmware_index.cache_info().currsize == 1
+
+
+def test_firmware_autodetection_disabled():
+    """Autodetection can be turned off."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    )
+    parser = module.HargassnerMessageParser("V14_1HAR_q1", auto_detect=False)
+    other = module.HargassnerMessageParser("V14_0HAR_q")
+    for _ in range(5):
+        parser.parse_message(_build_message(other))
+
+    assert parser.firmware_version == "V14_1HAR_q1"
+
+
+def test_compiled_templates_match_xml():
+    """Precompiled firmware tables are in sync with firmware_templates.py."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    )
+    const = pytest.importorskip("custom_components.bauergroup_hargassnerintegration.const")
+
+    for firmware in const.FIRMWARE_VERSIONS:
+        compiled = module.compile_schema(module.get_firmware_schema(firmware))
+        source = module.compile_schema(module.parse_firmware_template(firmware))
+        assert compiled == source, "run tools/compile_templates.py"
+
+
+def test_parameter_groups(parser):
+    """Counters and setpoints carry their publish group, others are fast."""
+    const = pytest.importorskip("custom_components.bauergroup_hargassnerintegration.const")
+    by_name = {param.name: param for param in parser.parameters}
+
+    assert by_name["Verbrauchszähler"].group == const.PARAMETER_GROUP_COUNTER
+    assert by_name["Anf. HKR3"].group == const.PARAMETER_GROUP_SETPOINT
+    assert by_name["O2"].group == const.PARAMETER_GROUP_FAST
+    assert by_name["O2soll"].group == const.PARAMETER_GROUP_FAST
@@ -0,0 +1,364 @@
+"""Tests for the telnet client."""
+import asyncio
+import threading
+import time
+import types
+
+import pytest
+
+FIRMWARE = "V14_1HAR_q1"
+
+
+def _values(frame):
+    """Return the parameter values of a frame."""
+    return {name: frame.get_value(name) for name in frame}
+
+
+class _Boiler:
+    """Local server sending pm frames to every client that connects."""
+
+    def __init__(self, frames: int, period: float, max_clients: int = 0) -> None:
+        self.frames = frames
+        self.period = period
+        self.max_clients = max_clients
+        self.connected_at: list[float] = []
+        self.last_sent: list[float | None] = []
+        self.writers: list[asyncio.StreamWriter] = []
+        self._active = 0
+        self._server = None
+        self.schema = pytest.importorskip(
+            "custom_components.bauergroup_hargassnerintegration.message_parser"
+        ).get_firmware_schema(FIRMWARE)
+
+    def frame(self, index: int) -> bytes:
+        """Return frame number index; TK carries the index."""
+        tokens = ["0"] * self.schema.expected_length
+        tokens[self.schema.by_name["TK"].index] = f"{index}.5"
+        return ("pm " + " ".join(tokens) + "\r\n").encode()
+
+    async def _serve(self, reader, writer):
+        """Send the frames, then keep the connection open but silent.
+
+        Beyond max_clients concurrent connections (0 = unlimited) a
+        connection is closed right away, like a single-client boiler.
+        """
+        self.connected_at.append(time.monotonic())
+        connection = len(self.last_sent)
+        self.last_sent.append(None)
+        self.writers.append(writer)
+        if self.max_clients and self._active >= self.max_clients:
+            writer.close()
+            return
+        self._active += 1
+        try:
+            for index in range(self.frames):
+                if writer.is_closing():
+                    return
+                writer.write(self.frame(index))
+                await writer.drain()
+                self.last_sent[connection] = time.monotonic()
+                await asyncio.sleep(self.period)
+            await reader.read()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._active -= 1
+            writer.close()
+
+    async def start(self) -> int:
+        """Start serving and return the port."""
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    def close(self) -> None:
+        """Stop accepting connections."""
+        self._server.close()
+
+
+@pytest.fixture
+def telnet_client():
+    """Return the telnet client module (requires Home Assistant)."""
+    return pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.telnet_client"
+    )
+
+
+def test_connection_info_is_a_snapshot(telnet_client):
+    """Kept connection info does not change with later statistics."""
+    client = telnet_client.HargassnerTelnetClient("127.0.0.1", "V14_1HAR_q1")
+    info = client.connection_info
+
+    client._stats["messages_received"] = 5
+
+    assert info.statistics["messages_received"] == 0
+    assert client.connection_info.statistics["messages_received"] == 5
+    with pytest.raises(TypeError):
+        info.statistics["messages_received"] = 1
+
+
+def test_parse_in_executor_matches_inline(telnet_client):
+    """Offloaded parsing yields the inline frames; the worker owns the parser."""
+    message_parser = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.message_parser"
+    )
+    threads = []
+
+    async def run():
+        boiler = _Boiler(frames=20, period=0.02)
+        port = await boiler.start()
+        client = telnet_client.HargassnerTelnetClient(
+            "127.0.0.1", FIRMWARE, port=port, parse_in_executor=True
+        )
+        frames = []
+        const = pytest.importorskip(
+            "custom_components.bauergroup_hargassnerintegration.const"
+        )
+        client.register_callback(frames.append, policy=const.CALLBACK_POLICY_DROP_OLDEST)
+        set_subscriptions = client._parser.set_subscriptions
+
+        def record_thread(names):
+            threads.append(threading.current_thread().name)
+            set_subscriptions(names)
+
+        client._parser.set_subscriptions = record_thread
+        await client.async_start()
+        executor = client._executor
+        await asyncio.sleep(0.2)
+        client.set_subscriptions(["TK"])
+        await asyncio.sleep(0.4)
+        await client.async_stop()
+        boiler.close()
+        return boiler, client, executor, frames
+
+    boiler, client, executor, frames = asyncio.run(run())
+
+    assert client.statistics["parse_seconds_offloaded"] > 0
+    assert len(frames) >= 10
+    reference = message_parser.HargassnerMessageParser(FIRMWARE)
+    for frame in frames:
+        index = int(frame.get_value("TK"))
+        expected = reference.parse_bytes(boiler.frame(index).rstrip())
+        if frame.get_value("TRG") is None:
+            # Parsed after the subscription change
+            assert _values(frame) == {"TK": expected.get_value("TK")}
+        else:
+            assert _values(frame) == _values(expected)
+    assert frames[-1].get_value("TRG") is None
+    assert threads and all(name.startswith("hargassner_parser") for name in threads)
+    assert client._executor is None
+    assert executor._shutdown
+
+
+def test_track_frame_counts_late_and_missed_frames(telnet_client):
+    """Gaps count after the warm-up; coalesced frames are not missed."""
+    client = telnet_client.HargassnerTelnetClient("127.0.0.1", FIRMWARE)
+    client._transport = types.SimpleNamespace(frames=0, coalesced=0)
+    stats = client._stats
+
+    # Warm-up: a 3 s gap among the first intervals is not counted
+    for now in (0.0, 1.0, 4.0, 5.0, 6.0, 7.0, 8.0):
+        client._track_frame(now)
+    assert stats["frames_late"] == stats["frames_missed"] == 0
+    assert stats["frame_interval"] == 1.0
+    period = stats["frame_period"]
+    assert 1.0 < period < 1.2
+
+    # Below 1.5 periods a frame is not late
+    client._track_frame(9.4)
+    assert stats["frames_late"] == 0
+
+    # A 3 s gap: late, the two frames in between are missed
+    period = stats["frame_period"]
+    client._track_frame(12.4)
+    assert stats["frames_late"] == 1
+    assert stats["frames_missed"] == round(3.0 / period) - 1 == 2
+    assert client._watchdog_since == 12.4
+
+    # A 4 s gap whose frames the transport coalesced is late, not missed
+    client._transport.coalesced = 2
+    client._track_frame(16.4)
+    assert stats["frames_late"] == 2
+    assert stats["frames_missed"] == 2
+
+
+def _sequences_increase(frames):
+    """Return whether frame sequence numbers strictly increase."""
+    sequences = [frame.sequence for frame in frames]
+    return all(later > earlier for earlier, later in zip(sequences, sequences[1:]))
+
+
+def test_hot_standby_failover(telnet_client):
+    """A dropped primary fails over to the standby without a sequence reset."""
+    const = pytest.importorskip("custom_components.bauergroup_hargassnerintegration.const")
+
+    async def run():
+        boiler = _Boiler(frames=1000, period=0.02)
+        port = await boiler.start()
+        client = telnet_client.HargassnerTelnetClient(
+            "127.0.0.1", FIRMWARE, port=port, hot_standby=True
+        )
+        frames = []
+        client.register_callback(frames.append, policy=const.CALLBACK_POLICY_DROP_OLDEST)
+        await client.async_start()
+        for _ in range(100):
+            if client.statistics["standby_state"] == "ready":
+                break
+            await asyncio.sleep(0.02)
+        ready = client.statistics["standby_state"]
+        before = len(frames)
+
+        boiler.writers[0].close()
+        await asyncio.sleep(0.3)
+        await client.async_stop()
+        boiler.close()
+        return client, frames, before, ready
+
+    client, frames, before, ready = asyncio.run(run())
+    stats = client.statistics
+
+    assert ready == "ready"
+    assert stats["failovers"] == 1
+    assert stats["reconnections"] == 1
+    assert 0 <= stats["failover_latency"] < 0.2
+    assert len(frames) > before + 5
+    assert _sequences_increase(frames)
+    assert stats["sequence"] == frames[-1].sequence
+
+
+def test_hot_standby_detects_single_client_boiler(telnet_client):
+    """A boiler refusing a second client disables hot standby."""
+
+    async def run():
+        boiler = _Boiler(frames=1000, period=0.02, max_clients=1)
+        port = await boiler.start()
+        client = telnet_client.HargassnerTelnetClient(
+            "127.0.0.1", FIRMWARE, port=port, hot_standby=True
+        )
+        await client.async_start()
+        for _ in range(100):
+            if client.statistics["standby_state"] != "connecting":
+                break
+            await asyncio.sleep(0.02)
+        parsed = client.statistics["messages_parsed"]
+        await asyncio.sleep(0.1)
+        await client.async_stop()
+        boiler.close()
+        return client, parsed
+
+    client, parsed = asyncio.run(run())
+
+    assert client.statistics["standby_state"] == "unsupported"
+    assert client._standby_supported is False
+    assert client.statistics["messages_parsed"] > parsed
+    assert client.statistics["failovers"] == 0
+
+
+def test_hot_standby_survives_unexpected_errors(telnet_client, monkeypatch, caplog):
+    """An unexpected standby error is logged and the standby retried."""
+    transport = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.transport"
+    )
+    monkeypatch.setattr(telnet_client, "TELNET_STANDBY_RETRY_DELAY", 0.05)
+    attempts = []
+
+    class BrokenTransport(transport.StreamTransport):
+        async def async_open(self):
+            attempts.append(time.monotonic())
+            raise RuntimeError("broken standby")
+
+    async def run():
+        boiler = _Boiler(frames=1000, period=0.02)
+        port = await boiler.start()
+        transports = iter([transport.StreamTransport("127.0.0.1", port)])
+        client = telnet_client.HargassnerTelnetClient(
+            "127.0.0.1",
+            FIRMWARE,
+            port=port,
+            hot_standby=True,
+            transport_factory=lambda: next(
+                transports, BrokenTransport("127.0.0.1", port)
+            ),
+        )
+        await client.async_start()
+        await asyncio.sleep(0.3)
+        running = client._standby_task is not None and not client._standby_task.done()
+        state = client.statistics["standby_state"]
+        await client.async_stop()
+        boiler.close()
+        return running, state
+
+    running, state = asyncio.run(run())
+
+    assert running
+    assert state == "connecting"
+    assert len(attempts) >= 2
+    assert "broken standby" in caplog.text
+
+
+def test_stale_timeout_follows_period_with_floor(telnet_client):
+    """The watchdog waits TELNET_STALE_FRAMES periods, at least the floor."""
+    client = telnet_client.HargassnerTelnetClient("127.0.0.1", FIRMWARE)
+
+    client._frame_period = 0.1
+    assert client._stale_timeout() == telnet_client.TELNET_STALE_MIN_TIMEOUT
+    client._frame_period = 2.0
+    assert client._stale_timeout() == telnet_client.TELNET_STALE_FRAMES * 2.0
+
+
+def test_silent_stream_reconnects_within_stale_frames(telnet_client, monkeypatch):
+    """A server that accepts and goes silent is dropped after N periods."""
+    monkeypatch.setattr(telnet_client, "TELNET_STALE_MIN_TIMEOUT", 0.3)
+    monkeypatch.setattr(telnet_client, "TELNET_RECONNECT_DELAY", 0.05)
+    period = 0.05
+
+    async def run():
+        boiler = _Boiler(frames=8, period=period)
+        port = await boiler.start()
+        client = telnet_client.HargassnerTelnetClient(
+            "127.0.0.1", FIRMWARE, port=port
+        )
+        started = time.monotonic()
+        await client.async_start()
+        ready = time.monotonic() - started
+        try:
+            for _ in range(100):
+                if len(boiler.connected_at) >= 2:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await client.async_stop()
+            boiler.close()
+        return boiler, client, ready
+
+    boiler, client, ready = asyncio.run(run())
+
+    # async_start returns once connected instead of waiting for its timeout
+    assert ready < 1.0
+    assert len(boiler.connected_at) >= 2
+    assert client.statistics["stale_reconnects"] >= 1
+    gap = boiler.connected_at[1] - boiler.last_sent[0]
+    stale = telnet_client.TELNET_STALE_FRAMES * period
+    assert stale * 0.8 <= gap <= stale + 0.05 + 0.3
+
+
+def test_backoff_is_jittered_and_capped(telnet_client, monkeypatch):
+    """Each delay lies in the upper half of its step; steps stop at 300 s."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    client = telnet_client.HargassnerTelnetClient("127.0.0.1", FIRMWARE)
+    monkeypatch.setattr(telnet_client.asyncio, "sleep", fake_sleep)
+
+    async def run():
+        for _ in range(10):
+            await client._async_backoff()
+
+    asyncio.run(run())
+
+    step = telnet_client.TELNET_RECONNECT_DELAY
+    for delay in delays:
+        assert step / 2 <= delay <= step
+        step = min(step * 2, telnet_client.TELNET_MAX_RECONNECT_DELAY)
+    assert step == telnet_client.TELNET_MAX_RECONNECT_DELAY == 300
@@ -0,0 +1,107 @@
+"""Tests for the boiler transports."""
+import asyncio
+
+import pytest
+
+
+async def _serve(reader, writer):
+    """Send frames split across writes, then close."""
+    for chunk in (b"hello\r\npm 1 2", b" 3\r\npm 4\r\npm 5\r\npm 6", b" 7\r\n"):
+        writer.write(chunk)
+        await writer.drain()
+        await asyncio.sleep(0.05)
+    writer.close()
+
+
+async def _read_all(transport_class):
+    """Collect frames from a local server until it closes."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.exceptions"
+    )
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = transport_class("127.0.0.1", port)
+    lines = []
+    transport.line_sink = lambda line: lines.append(bytes(line))
+    await transport.async_open()
+    frames = []
+    try:
+        while True:
+            frame = await transport.async_read_frame(1.0)
+            if frame is not None:
+                frames.append(bytes(frame))
+    except module.HargassnerConnectionError:
+        pass
+    finally:
+        await transport.async_close()
+        server.close()
+    return frames, lines, transport
+
+
+@pytest.mark.parametrize("name", ["StreamTransport", "BufferedProtocolTransport"])
+def test_transport_emits_newest_complete_frames(name):
+    """Both transports reassemble lines and coalesce backlogged frames.
+
+    The line sink still sees every frame, including the coalesced ones.
+    """
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.transport"
+    )
+    frames, lines, transport = asyncio.run(_read_all(getattr(module, name)))
+
+    assert frames == [b"pm 5", b"pm 6 7"]
+    assert transport.frames == 4
+    assert transport.coalesced == 2
+    assert lines == [b"pm 1 2 3", b"pm 4", b"pm 5", b"pm 6 7"]
+
+
+async def _replay(transport):
+    """Read a replay transport until the end of the data."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.exceptions"
+    )
+    await transport.async_open()
+    frames = []
+    try:
+        while True:
+            frame = await transport.async_read_frame(1.0)
+            if frame is not None:
+                frames.append(frame)
+    except module.HargassnerEndOfDataError:
+        pass
+    return frames
+
+
+def test_replay_transport_reads_logs_and_captures(tmp_path):
+    """DAQ logs and capture files replay every frame in order."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.transport"
+    )
+    capture = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.capture"
+    )
+    log = tmp_path / "DAQ00000.DAQ"
+    log.write_bytes(
+        b"<DAQPRJ></DAQPRJ>\r\n"
+        b"2024-01-31_12:00:00 pm 1 2\r\n"
+        b"2024-01-31_12:00:01 pm 1 3\r\n"
+        b"pm 1 4\r\n"
+    )
+    capture.FrameCapture(tmp_path).write_batch([(1.0, b"pm 5"), (1.5, b"pm 6")])
+    paths = [log, *capture.capture_files(tmp_path)]
+
+    transport = module.ReplayTransport(paths, speed=module.REPLAY_SPEED_MAX)
+    frames = asyncio.run(_replay(transport))
+
+    assert frames == [b"pm 1 2", b"pm 1 3", b"pm 1 4", b"pm 5", b"pm 6"]
+    assert transport.frames == 5
+
+
+def test_replay_transport_rejects_negative_speed(tmp_path):
+    """Negative speeds are rejected, 0 replays as fast as possible."""
+    module = pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.transport"
+    )
+    with pytest.raises(ValueError):
+        module.ReplayTransport([tmp_path / "DAQ00000.DAQ"], speed=-1.0)
+    module.ReplayTransport([tmp_path / "DAQ00000.DAQ"], speed=module.REPLAY_SPEED_MAX)
@@ -0,0 +1,35 @@
+"""Tests for the boiler-state-adaptive update rate."""
+import pytest
+
+
+@pytest.fixture
+def update_rate():
+    """Return the update rate module (requires Home Assistant)."""
+    return pytest.importorskip(
+        "custom_components.bauergroup_hargassnerintegration.update_rate"
+    )
+
+
+def test_defaults_by_boiler_state(update_rate):
+    """Idle states publish rarely, ignition phases every second."""
+    intervals = update_rate.resolve_state_intervals({})
+
+    assert intervals[1] == 30  # Off
+    assert intervals[5] == 1  # Ignition
+    assert intervals[8] == 30  # Ember preservation
+    assert 7 not in intervals  # Full firing uses the minimum update interval
+
+
+def test_parse_and_resolve(update_rate):
+    """State names are case insensitive, the wildcard replaces defaults."""
+    overrides = update_rate.parse_state_intervals(" off=60, Full Firing=2,, *=5 ")
+    assert overrides == {"Off": 60.0, "Full firing": 2.0, "*": 5.0}
+
+    intervals = update_rate.resolve_state_intervals(overrides)
+    assert intervals[1] == 60.0
+    assert intervals[7] == 2.0
+    assert intervals[5] == 5.0
+
+    for text in ("Off", "=1", "Sleeping=1", "Off=-1", "Off=61", "Off=x", "Off=nan"):
+        with pytest.raises(ValueError):
+            update_rate.parse_state_intervals(text)
@@ -0,0 +1,34 @@
+"""Shared import helper for the tools.
+
+The package __init__ imports Home Assistant, so the tools register the
+package as a namespace for its directory and only run the modules they
+need.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "custom_components.bauergroup_hargassnerintegration"
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = REPO_ROOT / "custom_components" / "bauergroup_hargassnerintegration"
+
+
+def load_integration_module(name: str) -> types.ModuleType:
+    """Import an integration module without running the package __init__.
+
+    Args:
+        name: Module name inside the integration package
+
+    Returns:
+        Imported module
+    """
+    if PACKAGE not in sys.modules:
+        parent = types.ModuleType("custom_components")
+        parent.__path__ = [str(PACKAGE_DIR.parent)]
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules["custom_components"] = parent
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Firmware Template Compiler for the Hargassner Integration.
+
+Compiles the XML templates in firmware_templates.py into compact per-firmware
+JSON tables (custom_components/.../firmware/<version>.json). At runtime the
+integration loads only the table of the configured firmware and never parses
+XML or imports the full description table.
+
+Usage:
+    python compile_templates.py [--check]
+
+Examples:
+    python compile_templates.py           # (re)write all compiled tables
+    python compile_templates.py --check   # fail if a table is missing or stale
+"""
+
+import argparse
+import json
+import sys
+
+from _loader import load_integration_module
+
+
+def render(data: dict) -> str:
+    """Render compiled tables as compact JSON.
+
+    Args:
+        data: Compiled firmware tables
+
+    Returns:
+        JSON text
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compile firmware XML templates into per-firmware JSON tables"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only verify that compiled tables are present and up to date",
+    )
+    args = parser.parse_args()
+
+    const = load_integration_module("const")
+    message_parser = load_integration_module("message_parser")
+    output_dir = message_parser.COMPILED_TEMPLATES_DIR
+
+    stale = []
+    for firmware in const.FIRMWARE_VERSIONS:
+        schema = message_parser.parse_firmware_template(firmware)
+        text = render(message_parser.compile_schema(schema))
+        path = output_dir / f"{firmware}.json"
+        current = path.read_text(encoding="utf-8") if path.exists() else None
+
+        if current == text:
+            print(f"[OK] {firmware}: {path.name} up to date")
+            continue
+
+        if args.check:
+            stale.append(firmware)
+            print(f"[ERROR] {firmware}: {path.name} missing or stale")
+            continue
+
+        output_dir.mkdir(exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        print(f"[OK] {firmware}: wrote {path.name} ({len(text.encode('utf-8'))} bytes)")
+
+    if stale:
+        print("\nRun 'python tools/compile_templates.py' to update the compiled tables.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Import-Time Benchmark for the Hargassner Integration.
+
+Measures the cold start cost of the integration: importing its modules and
+loading the firmware tables for the first time. Every measurement runs in a
+fresh Python interpreter so nothing is cached; the median of several runs is
+reported. Use it to watch startup cost as more firmware versions are added.
+
+Usage:
+    python import_benchmark.py [--runs <n>] [--json]
+
+Examples:
+    python import_benchmark.py
+    python import_benchmark.py --runs 20
+    python import_benchmark.py --json > import_times.json
+"""
+
+import argparse
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from _loader import PACKAGE, REPO_ROOT, load_integration_module
+
+# Standard library modules always loaded in a Home Assistant process
+STDLIB_BASELINE = ["json", "logging", "pathlib"]
+
+# Home Assistant modules imported by the integration, loaded before timing the
+# full package so only the integration's own cost is measured
+HA_BASELINE = [
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.update_coordinator",
+]
+
+
+def measure(case: str, argument: str | None) -> float:
+    """Run one measurement in this (fresh) interpreter.
+
+    Args:
+        case: Measurement case name
+        argument: Firmware version for schema cases
+
+    Returns:
+        Elapsed time in milliseconds
+    """
+    for module in STDLIB_BASELINE:
+        importlib.import_module(module)
+
+    if case == "integration":
+        for module in HA_BASELINE:
+            importlib.import_module(module)
+        sys.path.insert(0, str(REPO_ROOT))
+        start = time.perf_counter()
+        for module in ("", ".sensor", ".config_flow"):
+            importlib.import_module(PACKAGE + module)
+        return (time.perf_counter() - start) * 1000
+
+    if case == "schema":
+        message_parser = load_integration_module("message_parser")
+        start = time.perf_counter()
+        message_parser.get_firmware_schema(argument)
+        return (time.perf_counter() - start) * 1000
+
+    if case == "schema_xml":
+        message_parser = load_integration_module("message_parser")
+        start = time.perf_counter()
+        message_parser.parse_firmware_template(argument)
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    load_integration_module(case)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_case(case: str, argument: str | None, runs: int) -> float | None:
+    """Measure a case in fresh interpreters and return the median.
+
+    Args:
+        case: Measurement case name
+        argument: Optional case argument
+        runs: Number of interpreter runs
+
+    Returns:
+        Median time in milliseconds, or None if the case failed
+    """
+    command = [sys.executable, str(Path(__file__).resolve()), "--measure", case]
+    if argument:
+        command += ["--argument", argument]
+
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            return None
+        samples.append(float(result.stdout.strip()))
+    return statistics.median(samples)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure cold import cost of the Hargassner integration"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Runs per case (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    parser.add_argument("--argument", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(f"{measure(args.measure, args.argument):.3f}")
+        return
+
+    firmware_versions = load_integration_module("const").FIRMWARE_VERSIONS
+
+    cases = [
+        ("message_parser", None, "import message_parser"),
+        ("firmware_templates", None, "import firmware_templates (XML source)"),
+    ]
+    for firmware in firmware_versions:
+        cases.append(("schema", firmware, f"load {firmware} (precompiled)"))
+        cases.append(("schema_xml", firmware, f"load {firmware} (XML parse)"))
+    cases.append(("integration", None, "import integration (HA preloaded)"))
+
+    results = {}
+    for case, argument, label in cases:
+        results[label] = run_case(case, argument, args.runs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Cold import cost (median of {args.runs} fresh interpreters)")
+    print("=" * 60)
+    for label, elapsed in results.items():
+        value = "n/a (Home Assistant not installed?)" if elapsed is None else f"{elapsed:8.2f} ms"
+        print(f"{label:<44} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,15 +17,15 @@ import json
 import random
 import sys
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Optional
 
-# Add parent directory to path to import firmware templates
-sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "bauergroup_hargassnerintegration"))
+from _loader import load_integration_module
 
 try:
-    from src.firmware_templates import FIRMWARE_TEMPLATES
-    from src.message_parser import HargassnerMessageParser
+    FIRMWARE_TEMPLATES = load_integration_module("firmware_templates").FIRMWARE_TEMPLATES
+    HargassnerMessageParser = load_integration_module(
+        "message_parser"
+    ).HargassnerMessageParser
 except ImportError:
     print("Error: Could not import firmware templates", file=sys.stderr)
     print("Make sure the integration is in the correct directory structure", file=sys.stderr)
@@ -47,7 +47,7 @@ class MessageGenerator:
             raise ValueError(f"Unknown firmware: {firmware}")
 
         # Parse template to get parameter structure
-        self.parser = HargassnerMessageParser(FIRMWARE_TEMPLATES[firmware])
+        self.parser = HargassnerMessageParser(firmware)
         self.param_count = len(self.parser.parameters)
 
         # Realistic value ranges for common parameters
@@ -14,18 +14,17 @@ Examples:
 
 import argparse
 import sys
-from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "bauergroup_hargassnerintegration"))
+from _loader import load_integration_module
 
 try:
-    from src.firmware_templates import (
-        FIRMWARE_TEMPLATES,
-        PARAMETER_DESCRIPTIONS,
-    )
-    from src.message_parser import HargassnerMessageParser
+    firmware_templates = load_integration_module("firmware_templates")
+    FIRMWARE_TEMPLATES = firmware_templates.FIRMWARE_TEMPLATES
+    PARAMETER_DESCRIPTIONS = firmware_templates.PARAMETER_DESCRIPTIONS
+    HargassnerMessageParser = load_integration_module(
+        "message_parser"
+    ).HargassnerMessageParser
 except ImportError:
     print("Error: Could not import firmware templates", file=sys.stderr)
     print("Make sure the integration is in the correct directory structure", file=sys.stderr)
@@ -81,9 +80,9 @@ class ParameterValidator:
         """Check that all templates can be parsed."""
         print("Checking template parsing...")
 
-        for firmware, template in FIRMWARE_TEMPLATES.items():
+        for firmware in FIRMWARE_TEMPLATES:
             try:
-                parser = HargassnerMessageParser(template)
+                parser = HargassnerMessageParser(firmware)
                 param_count = len(parser.parameters)
 
                 analog_count = sum(1 for p in parser.parameters if not p.is_digital)
@@ -105,9 +104,9 @@ class ParameterValidator:
         """
         all_params = set()
 
-        for firmware, template in FIRMWARE_TEMPLATES.items():
+        for firmware in FIRMWARE_TEMPLATES:
             try:
-                parser = HargassnerMessageParser(template)
+                parser = HargassnerMessageParser(firmware)
                 for param in parser.parameters:
                     all_params.add(param.name)
             except Exception:
@@ -151,9 +150,9 @@ class ParameterValidator:
         """Check for duplicate parameters within templates."""
         print("Checking for duplicates...")
 
-        for firmware, template in FIRMWARE_TEMPLATES.items():
+        for firmware in FIRMWARE_TEMPLATES:
             try:
-                parser = HargassnerMessageParser(template)
+                parser = HargassnerMessageParser(firmware)
                 param_names = [p.name for p in parser.parameters if not p.is_digital]
 
                 # Find duplicates
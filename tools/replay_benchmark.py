@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Replay Benchmark for the Hargassner Integration.
+
+Replays recorded frames (capture files written by the "Capture Raw Frames"
+option, or DAQ/text logs with pm lines) through the live client pipeline:
+transport, parser, frame stamping and callback fan-out. Use it to reproduce
+field incidents without a boiler or to benchmark the pipeline
+deterministically.
+
+Usage:
+    python replay_benchmark.py <file> [<file> ...] [--speed <factor>]
+        [--firmware <version>] [--parse-in-executor] [--callbacks <n>] [--json]
+
+Examples:
+    python replay_benchmark.py capture_20240131_120000_000000.pm.gz
+    python replay_benchmark.py DAQ00000.DAQ --speed 60
+    python replay_benchmark.py ~/.homeassistant/hargassner_capture/*/*.pm.gz --json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from _loader import load_integration_module
+
+
+async def replay(
+    files: list[str],
+    speed: float,
+    firmware: str,
+    parse_in_executor: bool,
+    callbacks: int,
+) -> dict:
+    """Replay recordings through the telnet client.
+
+    Args:
+        files: Recordings to replay in order
+        speed: Replay speed factor (0 = as fast as possible)
+        firmware: Firmware version used for parsing
+        parse_in_executor: Parse frames on a worker thread
+        callbacks: Number of data callbacks to register
+
+    Returns:
+        Benchmark results
+    """
+    telnet_client = load_integration_module("telnet_client")
+    transport = load_integration_module("transport")
+
+    client = telnet_client.HargassnerTelnetClient(
+        host="replay",
+        firmware_version=firmware,
+        parse_in_executor=parse_in_executor,
+        transport_factory=lambda: transport.ReplayTransport(files, speed),
+    )
+
+    for index in range(callbacks):
+
+        def on_frame(frame):
+            """Touch the frame like an entity update would."""
+            frame.get("ZK")
+
+        on_frame.__qualname__ = f"callback_{index + 1}"
+        client.register_callback(on_frame)
+
+    start = time.perf_counter()
+    await client.async_start()
+    await client.async_wait_finished()
+    # Let queued callbacks drain
+    await asyncio.sleep(0.1)
+    elapsed = time.perf_counter() - start
+    await client.async_stop()
+
+    stats = client.statistics
+    parsed = stats["messages_parsed"]
+    return {
+        "frames": stats["messages_received"],
+        "parsed": parsed,
+        "parse_errors": stats["parse_errors"],
+        "elapsed_s": round(elapsed, 3),
+        "frames_per_s": round(parsed / elapsed, 1) if elapsed else None,
+        "parse_us_per_frame": (
+            round((stats["parse_seconds"] + stats["parse_seconds_offloaded"]) / parsed * 1e6, 1)
+            if parsed
+            else None
+        ),
+        "frames_late": stats["frames_late"],
+        "frames_missed": stats["frames_missed"],
+        "stale_reconnects": stats["stale_reconnects"],
+        "callbacks": client.callback_statistics,
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded frames through the Hargassner client pipeline"
+    )
+    parser.add_argument("files", nargs="+", help="Capture files or DAQ/text logs")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="Speed factor, 1 = real time, 0 = as fast as possible (default: 0)",
+    )
+    parser.add_argument("--firmware", default="V14_1HAR_q1", help="Firmware version")
+    parser.add_argument(
+        "--parse-in-executor", action="store_true", help="Parse on a worker thread"
+    )
+    parser.add_argument(
+        "--callbacks", type=int, default=1, help="Number of data callbacks (default: 1)"
+    )
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+    if not args.speed >= 0:
+        parser.error("--speed must not be negative")
+
+    results = asyncio.run(
+        replay(args.files, args.speed, args.firmware, args.parse_in_executor, args.callbacks)
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    speed = "max" if args.speed == 0 else f"{args.speed:g}x"
+    print(f"Replay of {len(args.files)} file(s) at {speed} speed")
+    print("=" * 60)
+    for key, value in results.items():
+        if key != "callbacks":
+            print(f"{key:<24} {value}")
+    for name, callback in results["callbacks"].items():
+        print(f"{name}: delivered {callback['delivered']}, dropped {callback['dropped']}")
+
+
+if __name__ == "__main__":
+    main()